@@ -213,9 +213,10 @@ class SmartRetriever:
             return {"error": "No palace found"}
 
         try:
-            # Resolve the drawer_key so we can gather every sibling chunk. Fall
-            # back to the single row when there is no key (unchunked / legacy).
-            head = col.get(ids=[drawer_id], include=["metadatas"])
+            # Resolve the drawer_key so we can gather every sibling chunk. The head
+            # read carries the document too, so an unchunked / legacy drawer (no
+            # key) is answered from it — one store round-trip, not a second get.
+            head = col.get(ids=[drawer_id], include=["documents", "metadatas"])
             if not head["ids"]:
                 return {"error": f"Drawer not found: {drawer_id}"}
             drawer_key = (head["metadatas"][0] or {}).get("drawer_key")
@@ -235,11 +236,10 @@ class SmartRetriever:
                         "content": logical[0]["content"],
                         "metadata": logical[0]["metadata"],
                     }
-            single = col.get(ids=[drawer_id], include=["documents", "metadatas"])
             return {
                 "id": drawer_id,
-                "content": single["documents"][0],
-                "metadata": single["metadatas"][0],
+                "content": head["documents"][0],
+                "metadata": head["metadatas"][0],
             }
         except Exception as e:
             return {"error": str(e)}
@@ -278,3 +278,17 @@ def test_smart_search_include_full_expands_hits(retriever):
     retriever.get_full_content = lambda drawer_id: {"content": "FULL BODY"}
     out = retriever.smart_search("q", include_full=True)
     assert out["results"][0]["full_content"] == "FULL BODY"
+
+
+def test_get_full_content_unchunked_drawer_is_one_get(retriever):
+    calls = []
+
+    class _GetCollection:
+        def get(self, **kwargs):
+            calls.append(kwargs)
+            return {"ids": ["d1"], "documents": ["WHOLE"], "metadatas": [{"room": "r"}]}
+
+    retriever._get_collection = lambda: _GetCollection()
+    out = retriever.get_full_content("d1")
+    assert out == {"id": "d1", "content": "WHOLE", "metadata": {"room": "r"}}
+    assert len(calls) == 1  # no drawer_key -> answered from the head read
@@ -15,15 +15,20 @@ The LLM verification layer (F2) consumes the packets built here.
 
 from __future__ import annotations
 
+import json
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# dedup / flow_card are top-level modules in scripts/. Callers that import this
+# package already have scripts/ on sys.path; only add it when they do not.
+_SCRIPTS_DIR = str(Path(__file__).parent.parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
 
-from analyzers.base import VulnerabilityAnalyzer
-from analyzers.dom_xss import DOMXSSAnalyzer
+from .base import VulnerabilityAnalyzer
+from .dom_xss import DOMXSSAnalyzer
 from dedup import Finding
 from flow_card import FlowCard
 
@@ -39,27 +44,27 @@ def _get_analyzer(vuln_class: str) -> VulnerabilityAnalyzer | None:
         return _ANALYZER_REGISTRY[vuln_class]
 
     # Lazy import to avoid circular deps
-    from analyzers.cache_poisoning import CachePoisoningAnalyzer
-    from analyzers.clickjacking import ClickjackingAnalyzer
-    from analyzers.cors import CORSAnalyzer
-    from analyzers.csrf import CSRFAnalyzer
-    from analyzers.csti import CSTIAnalyzer
-    from analyzers.dom_clobbering import DOMClobberingAnalyzer
-    from analyzers.dom_data_manipulation import DOMDataManipulationAnalyzer
-    from analyzers.http_header_injection import HTTPHeaderInjectionAnalyzer
-    from analyzers.http_smuggling import HTTPSmugglingAnalyzer
-    from analyzers.idor import IDORAnalyzer
-    from analyzers.insecure_deserialization import InsecureDeserializationAnalyzer
-    from analyzers.link_manipulation import LinkManipulationAnalyzer
-    from analyzers.open_redirect import OpenRedirectAnalyzer
-    from analyzers.postmessage import PostMessageAnalyzer
-    from analyzers.prototype_pollution import PrototypePollutionAnalyzer
-    from analyzers.reflected_xss import ReflectedXSSAnalyzer
-    from analyzers.request_override import RequestOverrideAnalyzer
-    from analyzers.secret_disclosure import SecretDisclosureAnalyzer
-    from analyzers.sqli import SQLInjectionAnalyzer
-    from analyzers.ssrf import SSRFAnalyzer
-    from analyzers.stored_xss import StoredXSSAnalyzer
+    from .cache_poisoning import CachePoisoningAnalyzer
+    from .clickjacking import ClickjackingAnalyzer
+    from .cors import CORSAnalyzer
+    from .csrf import CSRFAnalyzer
+    from .csti import CSTIAnalyzer
+    from .dom_clobbering import DOMClobberingAnalyzer
+    from .dom_data_manipulation import DOMDataManipulationAnalyzer
+    from .http_header_injection import HTTPHeaderInjectionAnalyzer
+    from .http_smuggling import HTTPSmugglingAnalyzer
+    from .idor import IDORAnalyzer
+    from .insecure_deserialization import InsecureDeserializationAnalyzer
+    from .link_manipulation import LinkManipulationAnalyzer
+    from .open_redirect import OpenRedirectAnalyzer
+    from .postmessage import PostMessageAnalyzer
+    from .prototype_pollution import PrototypePollutionAnalyzer
+    from .reflected_xss import ReflectedXSSAnalyzer
+    from .request_override import RequestOverrideAnalyzer
+    from .secret_disclosure import SecretDisclosureAnalyzer
+    from .sqli import SQLInjectionAnalyzer
+    from .ssrf import SSRFAnalyzer
+    from .stored_xss import StoredXSSAnalyzer
 
     registry = {
         "dom_xss": DOMXSSAnalyzer(),
@@ -132,7 +137,6 @@ class LLMPacket:
 
     def estimate_tokens(self) -> int:
         """Estimate total token count (model-agnostic ~1 token per 4 chars)."""
-        import json
         text = (
             self.system_prompt +
             self.reference_excerpt +
@@ -229,6 +233,7 @@ class PythonVerifier:
             self.prompts_dir = Path(__file__).parent.parent / "assets" / "prompts"
         else:
             self.prompts_dir = prompts_dir
+        self._reference_cache: dict[str, str] = {}
 
     def verify(
         self,
@@ -445,14 +450,22 @@ class PythonVerifier:
         """Load the reference catalog for a vuln class (truncated for context budget).
         The retired per-class worker prompts are no longer a fallback — the catalogs
         are the single per-class knowledge source annie and the verifier read."""
+        cached = self._reference_cache.get(vuln_class)
+        if cached is not None:
+            return cached
         ref_path = self.prompts_dir.parent / "assets" / "references" / f"{vuln_class}.md"
-        if ref_path.exists():
-            content = ref_path.read_text()
-            # Truncate to first 3K chars (~750 tokens)
-            if len(content) > 3000:
-                content = content[:3000] + "\n\n[... truncated ...]"
-            return content
-        return ""
+        content = ""
+        try:
+            if ref_path.stat().st_size:
+                # Truncate to first 3K chars (~750 tokens) — read no more than that
+                with ref_path.open() as fh:
+                    content = fh.read(3001)
+                if len(content) > 3000:
+                    content = content[:3000] + "\n\n[... truncated ...]"
+        except FileNotFoundError:
+            content = ""
+        self._reference_cache[vuln_class] = content
+        return content
 
     def _build_verification_prompt(
         self,
@@ -26,6 +26,7 @@ Why a separate module:
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -146,15 +147,16 @@ def _is_library_filename(filename: str) -> bool:
     return any(p in fn_lower for p in _LIBRARY_PATTERNS)
 
 
+_NODE_MODULES_PKG_RE = re.compile(r"node_modules/(?:(@[^/]+/[^/]+)|([^/]+))/")
+
+
 def _count_source_map_packages(source_map_sources: list[str]) -> int:
     """Count distinct node_modules/<pkg>/ references in source map sources."""
     if not source_map_sources:
         return 0
-    import re
-    pattern = re.compile(r"node_modules/(?:(@[^/]+/[^/]+)|([^/]+))/")
     packages = set()
     for src in source_map_sources:
-        m = pattern.search(src)
+        m = _NODE_MODULES_PKG_RE.search(src)
         if m:
             packages.add(m.group(1) or m.group(2))
     return len(packages)
@@ -223,6 +223,14 @@ _KNOWN_VULN_SIGNATURES: dict[str, list[dict]] = {
     ],
 }
 
+# (library, cve_id) → signature, built once so lookups skip the per-library scan.
+# Each list is walked in reverse so the first entry wins if a CVE is listed twice.
+_KNOWN_SIGNATURE_INDEX: dict[tuple[str, str], dict] = {
+    (lib, sig.get("cve_id")): sig
+    for lib, sigs in _KNOWN_VULN_SIGNATURES.items()
+    for sig in reversed(sigs)
+}
+
 # Symbol extraction patterns from CVE descriptions
 # These help us parse function/method names from prose like:
 # "jQuery's $.extend() function is vulnerable..."
@@ -303,11 +311,10 @@ def _lookup_known_signature(
     if not library:
         return None
     lib_key = library.lower()
-    for variant in [lib_key, lib_key.replace(".", "").replace("-", "")]:
-        if variant in _KNOWN_VULN_SIGNATURES:
-            for sig in _KNOWN_VULN_SIGNATURES[variant]:
-                if sig.get("cve_id") == cve_id:
-                    return sig
+    for variant in (lib_key, lib_key.replace(".", "").replace("-", "")):
+        sig = _KNOWN_SIGNATURE_INDEX.get((variant, cve_id))
+        if sig is not None:
+            return sig
     return None
 
 
@@ -5,6 +5,7 @@ Consolidates raw findings into deduplicated, confidence-promoted, ranked
 merged findings.
 """
 
+import re
 import uuid
 from dataclasses import dataclass, field
 from typing import Any
@@ -14,7 +15,7 @@ from typing import Any
 # 1.2.1 Dataclasses
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """Raw finding from a single worker on a single chunk."""
     finding_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -34,7 +35,7 @@ class Finding:
     evidence: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class MergedFinding:
     """Finding after deduplication with promoted confidence."""
     merged_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -120,10 +121,12 @@ def sink_compatible(a: str, b: str) -> bool:
 # 1.2.4 Finding similarity
 # ---------------------------------------------------------------------------
 
+_CODE_TOKEN_RE = re.compile(r'[a-zA-Z_]\w+|\S')
+
+
 def _tokenize_code(snippet: str) -> set[str]:
     """Simple tokenization for Jaccard similarity."""
-    import re
-    return set(re.findall(r'[a-zA-Z_]\w+|\S', snippet.lower()))
+    return set(_CODE_TOKEN_RE.findall(snippet.lower()))
 
 
 def finding_similarity(a: Finding, b: Finding) -> float:
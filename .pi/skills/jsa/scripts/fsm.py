@@ -13,6 +13,7 @@ the engine migration.
 import json
 import math
 import uuid
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -142,6 +143,28 @@ def acquire_handler(state: JSAState) -> JSAState:
 # CVE_RESEARCH handler
 # ---------------------------------------------------------------------------
 
+def _read_head(path: Path, max_chars: int) -> str:
+    """Read the first N characters of a file without loading the rest of it
+    (same text as ``path.read_text(errors="replace")[:max_chars]``)."""
+    with open(path, errors="replace") as f:
+        return f.read(max_chars)
+
+
+def _fingerprint_file(engine, js_file: Path, head: str) -> list[dict]:
+    """Run the fingerprint engine over one file and return its detection details."""
+    return [
+        {
+            "technology": det.name,
+            "file": js_file.name,
+            "vector": det.vector,
+            "confidence": det.confidence,
+            "version": det.version,
+            "evidence": det.evidence,
+        }
+        for det in engine.detect(js_file.name, head)
+    ]
+
+
 def cve_research_handler(state: JSAState) -> JSAState:
     """
     Detect tech stack from acquired JS files using fingerprint matching.
@@ -172,38 +195,60 @@ def cve_research_handler(state: JSAState) -> JSAState:
     except Exception:
         engine_loaded = False
 
+    # ── Asset Classification (Priority 5) ──
+    # Classify each JS file by type: single component, multi-component bundle,
+    # first-party code, inline script, CDN bundle, or unknown. This drives
+    # correlation strength in CORRELATE_EVIDENCE — single components get full correlation,
+    # bundles without source maps get downgraded correlation.
+    # Runs in the same per-file pass as fingerprinting, so each 64K head is read
+    # once and released before the next file is opened.
+    file_classifications: dict[str, str] = {}
+    classify = None
+
     js_dir = state.js_dir
-    if js_dir.exists() and engine_loaded:
+    if js_dir.exists():
+        try:
+            from asset_classify import classify_file as classify
+        except Exception as e:
+            print(f"[cve_research_handler] Asset classification failed: {e}", flush=True)
+
         for js_file in js_dir.glob("*.js"):
-            fn = js_file.name.lower()
-            if "_inline_" in fn:
+            fn = js_file.name
+            if classify is not None and "_inline_" in fn:
+                # Already classified as inline
+                file_classifications[fn] = "inline"
+                continue
+            fingerprint = engine_loaded and "_inline_" not in fn.lower()
+            if not fingerprint and classify is None:
                 continue
 
-            # Read content for content-based matching
+            # Read content head for content-based matching and banner detection
             try:
-                head = js_file.read_text(errors="replace")[:65536]
+                head = _read_head(js_file, 65536)
             except Exception:
                 head = ""
 
-            # Run fingerprint engine
-            detections = engine.detect(js_file.name, head)
-
-            for det in detections:
-                name = det.name
-                tech_stack.setdefault(name, []).append(js_file.name)
-                if det.version and name not in versions:
-                    versions[name] = det.version
-                detection_details.append({
-                    "technology": name,
-                    "file": js_file.name,
-                    "vector": det.vector,
-                    "confidence": det.confidence,
-                    "version": det.version,
-                    "evidence": det.evidence,
-                })
-
-            if detections:
-                files_matched_by_scriptsrc.add(js_file.name)
+            file_details = _fingerprint_file(engine, js_file, head) if fingerprint else []
+            for det in file_details:
+                name = det["technology"]
+                tech_stack.setdefault(name, []).append(fn)
+                if det["version"] and name not in versions:
+                    versions[name] = det["version"]
+            detection_details.extend(file_details)
+            if file_details:
+                files_matched_by_scriptsrc.add(fn)
+
+            if classify is not None:
+                try:
+                    file_classifications[fn] = classify(
+                        filename=fn,
+                        content_head=head,
+                        source_map_sources=None,  # Could be enhanced later
+                        detection_details=file_details,
+                    ).classification
+                except Exception as e:
+                    print(f"[cve_research_handler] Asset classification failed: {e}", flush=True)
+                    classify = None
 
     # ── Source Map Parsing ──
     # Extract versions from //# sourceMappingURL= comments (inline base64
@@ -213,45 +258,6 @@ def cve_research_handler(state: JSAState) -> JSAState:
         js_dir, versions, tech_stack, files_matched_by_scriptsrc
     )
 
-    # ── Asset Classification (Priority 5) ──
-    # Classify each JS file by type: single component, multi-component bundle,
-    # first-party code, inline script, CDN bundle, or unknown. This drives
-    # correlation strength in CORRELATE_EVIDENCE — single components get full correlation,
-    # bundles without source maps get downgraded correlation.
-    file_classifications: dict[str, str] = {}
-    if js_dir.exists():
-        try:
-            from asset_classify import classify_file, ClassificationResult
-            # Group detection_details by file for the classifier
-            details_by_file: dict[str, list[dict]] = {}
-            for det in detection_details:
-                det_file = det.get("file", "")
-                if det_file:
-                    details_by_file.setdefault(det_file, []).append(det)
-
-            for js_file in js_dir.glob("*.js"):
-                fn = js_file.name
-                if "_inline_" in fn:
-                    # Already classified as inline
-                    file_classifications[fn] = "inline"
-                    continue
-
-                # Read content head for banner detection
-                try:
-                    head = js_file.read_text(errors="replace")[:65536]
-                except Exception:
-                    head = ""
-
-                result = classify_file(
-                    filename=fn,
-                    content_head=head,
-                    source_map_sources=None,  # Could be enhanced later
-                    detection_details=details_by_file.get(fn, []),
-                )
-                file_classifications[fn] = result.classification
-        except Exception as e:
-            print(f"[cve_research_handler] Asset classification failed: {e}", flush=True)
-
     # ── Fallback: content-based version extraction ──
     # Wappalyzer doesn't scan file content for version comments like
     # /*! jQuery v3.7.1 */. These content patterns supplement the
@@ -301,7 +307,7 @@ def cve_research_handler(state: JSAState) -> JSAState:
                 # Read MORE than 64KB for libraries that put version info deep
                 # in the file (e.g. React's ReactVersion is in the first 1KB,
                 # but Angular's UMD wrapper may have the version at the end).
-                head = js_file.read_text(errors="replace")[:262144]
+                head = _read_head(js_file, 262144)
             except Exception:
                 continue
 
@@ -525,7 +531,6 @@ def _extract_source_map_versions(
     Returns count of libraries added or updated via source maps.
     """
     import base64
-    import json
     import re
 
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB — skip entirely
@@ -915,9 +920,10 @@ def agent_reviewer_handler(state: JSAState) -> None:
     verdicts = _local_agent_review(packets if "packets" in locals() else [])
     agent_review_meta["verdicts"] = verdicts
     agent_review_meta["total_candidates"] = len(candidate_ids)
-    agent_review_meta["verdicts_exploitable"] = sum(1 for v in verdicts if v.get("verdict") == "exploitable")
-    agent_review_meta["verdicts_not_exploitable"] = sum(1 for v in verdicts if v.get("verdict") == "not_exploitable")
-    agent_review_meta["verdicts_needs_deeper"] = sum(1 for v in verdicts if v.get("verdict") == "needs_deeper")
+    verdict_counts = Counter(v.get("verdict") for v in verdicts)
+    agent_review_meta["verdicts_exploitable"] = verdict_counts["exploitable"]
+    agent_review_meta["verdicts_not_exploitable"] = verdict_counts["not_exploitable"]
+    agent_review_meta["verdicts_needs_deeper"] = verdict_counts["needs_deeper"]
 
     state.metadata["agent_review"] = agent_review_meta
     state.updated_at = datetime.now(timezone.utc).isoformat()
@@ -1471,9 +1477,10 @@ def sast_validate_handler(state: JSAState) -> JSAState:
             validated.append({**f, "validation": classification})
         state.sast_validated = validated
         state.metadata["sast_validate"]["total"] = len(validated)
-        state.metadata["sast_validate"]["confirmed"] = sum(1 for v in validated if v["validation"] == "confirmed")
-        state.metadata["sast_validate"]["false_positive"] = sum(1 for v in validated if v["validation"] == "false_positive")
-        state.metadata["sast_validate"]["needs_deeper"] = sum(1 for v in validated if v["validation"] == "needs_deeper")
+        validation_counts = Counter(v["validation"] for v in validated)
+        state.metadata["sast_validate"]["confirmed"] = validation_counts["confirmed"]
+        state.metadata["sast_validate"]["false_positive"] = validation_counts["false_positive"]
+        state.metadata["sast_validate"]["needs_deeper"] = validation_counts["needs_deeper"]
 
     state.updated_at = datetime.now(timezone.utc).isoformat()
     return state
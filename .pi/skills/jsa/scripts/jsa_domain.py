@@ -302,23 +302,25 @@ def _write_cve_research_stub(st: Any) -> None:
     versions = cve_meta.get("versions", {}) or {}
     cves = cve_meta.get("cves", []) or []
     tech_hints = cve_meta.get("tech_stack_hints", {}) or {}
-    content = (
+    parts = [
         f"## CVE Research — session {st.session_id}\n\n"
         f"**Target:** {st.target_url}\n"
         f"**Technologies detected:** {cve_meta.get('technologies_detected', 0)}\n"
         f"**Versions extracted:** {len(versions)}\n"
         f"**CVEs found:** {cve_meta.get('cve_count', len(cves))}\n"
         f"**Tech stack:** {list(tech_hints.keys())}\n\n### Detected tech + versions:\n"
-    )
-    for tech, ver in sorted(versions.items()):
-        content += f"- **{tech}** v{ver}\n"
+    ]
+    # One join at the end: the versions list is unbounded, so repeated `+=` would
+    # recopy the growing markdown once per detected library.
+    parts.extend(f"- **{tech}** v{ver}\n" for tech, ver in sorted(versions.items()))
     if cves:
-        content += "\n### Top CVEs:\n"
-        for cve in cves[:10]:
-            content += (
-                f"- **{cve.get('cve_id', 'unknown')}** "
-                f"({cve.get('library', '?')}, CVSS {cve.get('cvss_score', '?')})\n"
-            )
+        parts.append("\n### Top CVEs:\n")
+        parts.extend(
+            f"- **{cve.get('cve_id', 'unknown')}** "
+            f"({cve.get('library', '?')}, CVSS {cve.get('cvss_score', '?')})\n"
+            for cve in cves[:10]
+        )
+    content = "".join(parts)
     existing.append(
         {
             "wing": "wing_jsa",
@@ -238,6 +238,30 @@ class TestCveResearchHandler:
         assert "jquery-3.7.1.min.js" in tech_stack["jQuery"]
         assert versions.get("jQuery") == "3.7.1"
 
+    def test_bundle_head_read_once_for_fingerprint_and_classification(
+        self, state_with_dir: JSAState, temp_js_dir: Path
+    ):
+        """Fingerprinting and asset classification share one 64K head read."""
+        import fsm
+
+        (temp_js_dir / "jquery-3.7.1.min.js").write_text("/*! jQuery v3.7.1 */\n")
+        (temp_js_dir / "page_inline_0.js").write_text("init();\n")
+        calls: list[tuple[str, int]] = []
+        real = fsm._read_head
+
+        def spy(path, max_chars):
+            calls.append((Path(path).name, max_chars))
+            return real(path, max_chars)
+
+        with patch.object(fsm, "_read_head", spy):
+            result = cve_research_handler(state_with_dir)
+
+        assert calls.count(("jquery-3.7.1.min.js", 65536)) == 1
+        assert ("page_inline_0.js", 65536) not in calls
+        classifications = result.metadata["cve_research"]["file_classifications"]
+        assert "jquery-3.7.1.min.js" in classifications
+        assert classifications["page_inline_0.js"] == "inline"
+
     def test_handler_with_content_version_fallback(self, state_with_dir: JSAState, temp_js_dir: Path):
         """Content-based version extraction should work even without Wappalyzer filename match."""
         # Create a file with jQuery version comment but generic filename
@@ -450,6 +474,16 @@ class TestContentVersionFallback:
         result = cve_research_handler(state_with_dir)
         assert result.metadata["cve_research"]["versions"].get("D3") == "7.8.5"
 
+    def test_read_head_matches_sliced_read_text(self, temp_js_dir: Path):
+        """_read_head(path, n) is read_text(errors="replace")[:n] for multi-byte and CRLF text."""
+        import fsm
+
+        path = temp_js_dir / "vendor.js"
+        path.write_bytes("/*! d3 v7.8.5 — ✓ ünï */\r\nvar é = 1;\r\n".encode() + b"\xff\r\n")
+        text = path.read_text(errors="replace")
+        for n in range(len(text) + 2):
+            assert fsm._read_head(path, n) == text[:n]
+
 
 # ---------------------------------------------------------------------------
 # Source Map Parsing Tests
@@ -1031,3 +1065,26 @@ class TestVexStatus:
         assign_initial_vex_status(cves, versions, None)
         assert cves[0]["vex_status"] == "affected"
         assert cves[0]["component_confidence"] == "possible"
+
+
+class TestCveResearchStub:
+    """The mempalace stub rendered from cve_research metadata."""
+
+    def test_stub_lists_sorted_versions_and_top_cves(self, state_with_dir):
+        from jsa_domain import _write_cve_research_stub, read_mempalace_stubs
+
+        state_with_dir.metadata["cve_research"] = {
+            "versions": {"lodash": "4.17.15", "jquery": "1.12.4"},
+            "cves": [
+                {"cve_id": f"CVE-2020-{i:04d}", "library": "jquery", "cvss_score": 6.1}
+                for i in range(12)
+            ],
+        }
+        _write_cve_research_stub(state_with_dir)
+
+        [stub] = read_mempalace_stubs(state_with_dir.output_dir)
+        content = stub["content"]
+        assert stub["room"] == "test-cve-research-cve-research"
+        assert "- **jquery** v1.12.4\n- **lodash** v4.17.15\n\n### Top CVEs:\n" in content
+        assert content.count("- **CVE-2020-") == 10
+        assert content.endswith("- **CVE-2020-0009** (jquery, CVSS 6.1)\n")
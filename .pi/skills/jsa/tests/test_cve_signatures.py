@@ -103,6 +103,14 @@ class TestKnownSignatureLookup:
         sig = _lookup_known_signature("unknown-lib", "CVE-9999-99999")
         assert sig is None
 
+    def test_lookup_known_cve_under_other_library(self):
+        assert _lookup_known_signature("lodash", "CVE-2019-11358") is None
+
+    def test_every_table_entry_is_found(self):
+        for lib, sigs in _KNOWN_VULN_SIGNATURES.items():
+            for sig in sigs:
+                assert _lookup_known_signature(lib, sig["cve_id"])["cve_id"] == sig["cve_id"]
+
 
 # ---------------------------------------------------------------------------
 # extract_cve_signature tests
@@ -454,6 +454,38 @@ class TestLLMPacketBuilding:
             assert result.llm_packet.packet_type == "deep_analysis"
             assert result.llm_packet.max_output_tokens == 1000
 
+    def test_reference_excerpt_truncated_and_cached(self, tmp_path):
+        """Reference catalogs are read once per class, only up to the excerpt cap."""
+        refs = tmp_path / "assets" / "references"
+        refs.mkdir(parents=True)
+        (refs / "dom_xss.md").write_text("x" * 5000)
+        (refs / "cors.md").write_text("")
+        verifier = PythonVerifier(prompts_dir=tmp_path / "prompts")
+
+        excerpt = verifier._load_reference_excerpt("dom_xss")
+        assert excerpt == "x" * 3000 + "\n\n[... truncated ...]"
+        assert verifier._load_reference_excerpt("cors") == ""
+        assert verifier._load_reference_excerpt("missing") == ""
+
+        (refs / "dom_xss.md").unlink()
+        assert verifier._load_reference_excerpt("dom_xss") == excerpt
+
+    def test_reference_excerpt_read_error_propagates_uncached(self, tmp_path, monkeypatch):
+        """Errors other than a missing catalog surface and are not cached."""
+        refs = tmp_path / "assets" / "references"
+        refs.mkdir(parents=True)
+        (refs / "dom_xss.md").write_text("catalog")
+        verifier = PythonVerifier(prompts_dir=tmp_path / "prompts")
+
+        def denied(*args, **kwargs):
+            raise PermissionError("denied")
+
+        monkeypatch.setattr(Path, "open", denied)
+        with pytest.raises(PermissionError):
+            verifier._load_reference_excerpt("dom_xss")
+        monkeypatch.undo()
+        assert verifier._load_reference_excerpt("dom_xss") == "catalog"
+
 
 # ---------------------------------------------------------------------------
 # Test full F3 hybrid scenario
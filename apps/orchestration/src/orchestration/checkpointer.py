@@ -25,6 +25,7 @@ WAL mode + a busy timeout allow concurrent readers. See pack
 
 from __future__ import annotations
 
+import json
 import os
 import sqlite3
 from dataclasses import dataclass
@@ -41,6 +42,8 @@ STATUS_ERROR = "error"
 
 # Statuses that the auto-recovery scan considers resumable.
 PENDING_STATUSES: tuple[str, ...] = (STATUS_RUNNING, STATUS_AWAITING_USER)
+# Statuses of a finished run (membership-tested on every ``status`` call).
+TERMINAL_STATUSES: frozenset[str] = frozenset({STATUS_COMPLETE, STATUS_ERROR})
 
 _SCHEMA = """
 CREATE TABLE IF NOT EXISTS runs (
@@ -53,11 +56,25 @@ CREATE TABLE IF NOT EXISTS runs (
   created_at       TEXT,
   updated_at       TEXT
 );
-CREATE INDEX IF NOT EXISTS idx_runs_session ON runs(session_id);
-CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status);
+-- Composite indexes for the recovery scan (status [+ session] ordered by updated_at)
+-- and the terminal-run purge (status + updated_at cutoff), so the updated_at order /
+-- cutoff is read from the index too. Their leading columns cover the former
+-- single-column session/status indexes, which are dropped from older DBs so an
+-- upsert maintains two indexes, not four.
+DROP INDEX IF EXISTS idx_runs_session;
+DROP INDEX IF EXISTS idx_runs_status;
+CREATE INDEX IF NOT EXISTS idx_runs_status_updated ON runs(status, updated_at);
+CREATE INDEX IF NOT EXISTS idx_runs_session_status ON runs(session_id, status, updated_at);
 """
 
 
+# Context (de)serialization for the ``context_json`` column, built once. The
+# encoder writes compact separators — the column is machine-read only, and the
+# default ", " / ": " padding is pure size on every checkpoint write.
+_CONTEXT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+_CONTEXT_DECODER = json.JSONDecoder()
+
+
 def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -78,7 +95,7 @@ def _default_db_path(project_root: str | Path | None) -> Path:
     return root / ".penny" / "orchestration.db"
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckpointRecord:
     run_id: str
     session_id: str
@@ -130,10 +147,8 @@ class Checkpointer:
         status: str,
     ) -> None:
         """Upsert a run's state. ``created_at`` is preserved across updates."""
-        import json
-
         now = _now()
-        ctx_json = json.dumps(context.to_dict())
+        ctx_json = _CONTEXT_ENCODER.encode(context.to_dict())
         conn = self._connect()
         try:
             conn.execute(
@@ -165,9 +180,7 @@ class Checkpointer:
             conn.close()
 
     def _row_to_record(self, row: sqlite3.Row) -> CheckpointRecord:
-        import json
-
-        ctx = RunContext.from_dict(json.loads(row["context_json"]))
+        ctx = RunContext.from_dict(_CONTEXT_DECODER.decode(row["context_json"]))
         return CheckpointRecord(
             run_id=row["run_id"],
             session_id=row["session_id"],
@@ -187,6 +200,19 @@ class Checkpointer:
         finally:
             conn.close()
 
+    def load_status(self, run_id: str) -> tuple[str, str] | None:
+        """``(current_state_id, status)`` for a run, or None. Reads two columns and
+        never decodes ``context_json`` — for callers (the ``status`` command) that
+        need the position, not a rehydrated ``RunContext``."""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT current_state_id, status FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            return (row["current_state_id"], row["status"]) if row else None
+        finally:
+            conn.close()
+
     def list_pending(self, session_id: str | None = None) -> list[CheckpointRecord]:
         """Return resumable runs (status running/awaiting_user), for the
         auto-recovery scan. Optionally scoped to one session."""
@@ -49,9 +49,11 @@ _KEYS: tuple[str, ...] = (
     "complete",
     "errors",
 )
+_KEY_SET: frozenset[str] = frozenset(_KEYS)
+_REQUIRED_KEYS: tuple[str, ...] = ("session_id", "run_id", "playbook")
 
 
-@dataclass
+@dataclass(slots=True)
 class RunContext:
     # identity / routing
     session_id: str
@@ -93,7 +95,8 @@ class RunContext:
     # retries; stall / progress-assessment). A playbook appends one entry per
     # completed retry iteration via BasePlaybook.record_iteration; the base's
     # strategy_repeated / is_stalled read it. Entries are small digests, not
-    # payloads (gaps summary, the declared strategy_change, confidence).
+    # payloads (gaps summary, the declared strategy_change, confidence); only the
+    # most recent BasePlaybook.ITERATION_HISTORY_CAP entries are retained.
     iteration_history: list[dict[str, Any]] = field(default_factory=list)
 
     # Recall (atom F2): distilled lessons retrieved at start() and injected into
@@ -123,24 +126,15 @@ class RunContext:
         """
         if not isinstance(d, dict):
             raise TypeError(f"RunContext.from_dict expects a dict, got {type(d).__name__}")
-        unknown = set(d) - set(_KEYS)
+        unknown = d.keys() - _KEY_SET
         if unknown:
             raise ValueError(
                 f"RunContext.from_dict: unknown keys {sorted(unknown)} — checkpoint "
                 "schema drift. Add the key to _KEYS, or stash playbook data in extras."
             )
-        try:
-            kwargs = {
-                "session_id": d["session_id"],
-                "run_id": d["run_id"],
-                "playbook": d["playbook"],
-            }
-        except KeyError as exc:
-            raise ValueError(f"RunContext.from_dict missing required key: {exc}") from exc
-
-        for k in _KEYS:
-            if k in kwargs:
-                continue
-            if k in d:
-                kwargs[k] = d[k]
-        return cls(**kwargs)
+        for k in _REQUIRED_KEYS:
+            if k not in d:
+                raise ValueError(f"RunContext.from_dict missing required key: {k!r}")
+        # Every present key is known (checked above), so this is the whole
+        # constructor call in one pass — no per-key re-probe of the input.
+        return cls(**{k: d[k] for k in _KEYS if k in d})
@@ -16,8 +16,17 @@ what retires the legacy state-on-argv transport). See
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
+# Shared read-only empty mapping for absent contract sections and default
+# topologies. Read paths used to allocate a throwaway ``{}`` per lookup (e.g.
+# ``contract.get("optional", {})`` on every SUMMARY validated); a single
+# immutable instance serves every such default without a per-call allocation
+# and cannot be mutated by accident.
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
 # ---------------------------------------------------------------------------
 # Confidence taxonomy (§2). Canonical, reused from Penny. UNCERTAIN triggers the
 # engine's escalation path; every escalating primitive SUMMARY must include one.
@@ -165,13 +174,13 @@ def validate_summary_contract(name: str, contract: dict, summary: Any) -> tuple[
     if not isinstance(summary, dict):
         return False, f"{name}: summary must be a dict, got {type(summary).__name__}"
 
-    for field, typ in contract.get("required", {}).items():
+    for field, typ in contract.get("required", EMPTY_MAPPING).items():
         if field not in summary:
             return False, f"{name}: missing required '{field}'"
         if not _type_ok(summary[field], typ):
             return False, f"{name}: '{field}' must be {typ.__name__}"
 
-    for field, typ in contract.get("optional", {}).items():
+    for field, typ in contract.get("optional", EMPTY_MAPPING).items():
         if field in summary and not _type_ok(summary[field], typ):
             return False, f"{name}: optional '{field}' must be {typ.__name__}"
 
@@ -43,8 +43,10 @@ playbook-owned; the base never hardcodes them.
 
 from __future__ import annotations
 
+import functools
 import os
 import sys
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any, Callable, Optional
 
@@ -53,9 +55,16 @@ from .checkpointer import (
     STATUS_COMPLETE,
     STATUS_ERROR,
     STATUS_RUNNING,
+    TERMINAL_STATUSES,
     Checkpointer,
 )
-from .contracts import Confidence, Directives, validate_summary_contract, weakest_confidence
+from .contracts import (
+    EMPTY_MAPPING,
+    Confidence,
+    Directives,
+    validate_summary_contract,
+    weakest_confidence,
+)
 from .context import RunContext
 from .loans import loan_enabled
 from .outcome_writer import record_outcome
@@ -87,6 +96,8 @@ def _autonomy_ask_reason(action_text: str) -> Optional[str]:
 
 TERMINAL_STATES: frozenset[str] = frozenset({"complete", "error"})
 _DEFAULT_STEP_CAP = 50
+# Sentinel: "fan-out spec not resolved yet" (``None`` already means "not parallel").
+_UNRESOLVED: Any = object()
 
 
 # ── #33: shared HITL gate-answer intent classifier ───────────────────────────
@@ -105,13 +116,20 @@ _GATE_DENY = frozenset({
     "deny", "denied", "no", "n", "abort", "cancel", "discard", "stop",
     "reject", "rejected",
 })
+# Model confidence levels strong enough to act on a free-text approval.
+_GATE_APPROVE_CONFIDENCE = frozenset({Confidence.CERTAIN, Confidence.PROBABLE})
 # #26/#27: model-judged loop guards (gated; the string checks stay as the fallback).
 _STALL_MODEL_ENV = "PI_STALL_MODEL"
 _STRATEGY_MODEL_ENV = "PI_STRATEGY_MODEL"
 
 
+@functools.lru_cache(maxsize=1)
 def _load_detect():
-    """Lazy-import the shared detect() primitive (scripts/system/lib, #8), or None."""
+    """Lazy-import the shared detect() primitive (scripts/system/lib, #8), or None.
+
+    Memoized: the lib location is fixed for the life of the process, and the
+    loop guards and gate classifier may each ask for it on the same step, so the
+    parents walk + ``is_dir`` probes + ``sys.path`` scan run once."""
     try:
         for parent in Path(__file__).resolve().parents:
             lib = parent / "scripts" / "system" / "lib"
@@ -125,6 +143,15 @@ def _load_detect():
     return None
 
 
+@functools.lru_cache(maxsize=1024)
+def _norm_label(text: str) -> str:
+    """Memoized body of ``BasePlaybook._norm_text``. The loop guards re-normalize
+    the same strategy/gap strings every iteration (each recorded digest is compared
+    against every later SUMMARY), so repeat labels are a cache hit, not a fresh
+    lower()/split()/join() allocation."""
+    return " ".join(text.lower().split())
+
+
 def _needs_summary_restatement() -> bool:
     """#28: the SUMMARY-restatement directive is a crutch for weaker models that drop a
     mid-prompt output contract. A capability-tier deployment declares its models don't
@@ -133,6 +160,41 @@ def _needs_summary_restatement() -> bool:
     return os.environ.get("PI_MODEL_TIER", "").strip().lower() != "strong"
 
 
+# Rendered SUMMARY-restatement text per contract. The restatement is a pure
+# function of the (static) contract but was rebuilt for every directive and every
+# fan-out branch. Keyed by ``id(contract)``; the entry holds the contract itself,
+# so the id cannot be recycled while cached and a hit is confirmed by identity.
+_SCHEMA_DIRECTIVES: dict[int, tuple[dict, str]] = {}
+_SCHEMA_DIRECTIVES_MAX = 256
+_SCHEMA_PLACEHOLDER = {bool: "<true|false>", int: "<int>", str: "<string>", list: "<[...]>"}
+
+
+def _render_summary_schema(contract: dict) -> str:
+    """The OUTPUT FORMAT directive for ``contract`` ("" when it declares no keys)."""
+    required = contract.get("required") or EMPTY_MAPPING
+    optional = contract.get("optional") or EMPTY_MAPPING
+    if not required and not optional:
+        return ""
+
+    def _render(fields: Mapping[str, Any]) -> str:
+        return ", ".join(
+            f'"{key}": {_SCHEMA_PLACEHOLDER.get(typ, "<value>")}' for key, typ in fields.items()
+        )
+
+    rendered = [chunk for chunk in (_render(required), _render(optional)) if chunk]
+    schema = "{" + ", ".join(rendered) + "}"
+    req_keys = ", ".join(required.keys()) or "(none)"
+    return (
+        "\n\nOUTPUT FORMAT — this is the FINAL and most important directive; obey it exactly.\n"
+        "Your response MUST end with ONE line: `SUMMARY:` immediately followed by a single-line "
+        "JSON object with these EXACT keys. Replace every `<...>` placeholder with a real value "
+        "from your work and output valid JSON (booleans true/false and numbers unquoted, strings "
+        f"quoted, arrays in []). Required keys (must be present): {req_keys}. Emit NOTHING after "
+        "that line.\n"
+        f"SUMMARY:{schema}"
+    )
+
+
 _TIER_BUDGET_FACTOR = {"strong": 2.0, "cheap": 0.5}
 
 
@@ -147,6 +209,28 @@ def tier_budget(base: int, *, ceiling: int) -> int:
     return max(1, min(int(ceiling), round(base * factor)))
 
 
+# Per-machine transition table: ``{state_id: frozenset(event ids)}`` built once
+# per ``machine_cls`` from the class-level graph. The graph is static, so the
+# events declared out of a state never change at runtime; ``fire_model_route``
+# checks membership here instead of materializing ``sm.allowed_events`` (a fresh
+# list of bound Event objects) on every model-owned routing decision.
+_TRANSITION_TABLES: dict[type, dict[str, frozenset[str]]] = {}
+
+
+def _transition_table(machine_cls: type) -> dict[str, frozenset[str]]:
+    """The cached ``state_id -> event ids`` table for ``machine_cls``."""
+    table = _TRANSITION_TABLES.get(machine_cls)
+    if table is None:
+        table = {
+            s.id: frozenset(e.id for e in s.transitions.unique_events) for s in machine_cls.states
+        }
+        _TRANSITION_TABLES[machine_cls] = table
+    return table
+
+
+# Evidence items kept on ``ctx.verify_evidence`` (each capped at 300 chars).
+_EVIDENCE_KEEP = 5
+
 # Budget boundary on fan width (code caps, the model spends): a dynamic fan-out
 # may not exceed this many branches unless the caller raises
 # ``constraints["max_fan_width"]``.
@@ -183,6 +267,10 @@ class BasePlaybook:
     # cannot use the generic base ``progress_check`` sets this False (playbooks
     # with their own ``progress_check`` override are unaffected either way).
     LOOP_GUARDS: bool = True
+    # Retention bound on ``ctx.iteration_history``. The guards only ever read the
+    # most recent entries (``is_stalled``'s window, the last declared strategy), but
+    # the list rides every checkpoint write, so a long loop keeps only this tail.
+    ITERATION_HISTORY_CAP: int = 32
     # Engine-owned FSM events a model-chosen route may never fire directly.
     RESERVED_EVENTS: frozenset[str] = frozenset({"to_unknown", "escalate", "clarify", "abort"})
 
@@ -322,7 +410,7 @@ class BasePlaybook:
             return "refine"
         intent = str(result.get("answer", "")).strip().lower()
         confidence = str(result.get("confidence", "")).strip().upper()
-        if intent == "approve" and confidence in ("CERTAIN", "PROBABLE"):
+        if intent == "approve" and confidence in _GATE_APPROVE_CONFIDENCE:
             return "approve"
         if intent == "deny":
             return "deny"
@@ -334,7 +422,7 @@ class BasePlaybook:
     def _norm_text(value: Any) -> str:
         """Whitespace/case-normalized text, for comparing declared strategies and
         gap descriptions across iterations."""
-        return " ".join(str(value).lower().split())
+        return _norm_label(value if isinstance(value, str) else str(value))
 
     def record_iteration(
         self,
@@ -348,15 +436,24 @@ class BasePlaybook:
         retrying playbook calls this once per completed iteration (typically in
         the retry branch of ``route_after``) so ``strategy_repeated`` and
         ``is_stalled`` have history to compare against."""
-        ctx.iteration_history.append(
+        self._append_iteration(
+            ctx,
             {
                 "iteration": ctx.iteration,
                 "strategy_change": self._norm_text(strategy_change),
                 "gaps": [self._norm_text(g) for g in (gaps or [])],
                 "confidence": confidence,
-            }
+            },
         )
 
+    def _append_iteration(self, ctx: RunContext, digest: dict[str, Any]) -> None:
+        """Append one digest, dropping the oldest beyond ``ITERATION_HISTORY_CAP``."""
+        history = ctx.iteration_history
+        history.append(digest)
+        overflow = len(history) - max(1, self.ITERATION_HISTORY_CAP)
+        if overflow > 0:
+            del history[:overflow]
+
     def strategy_repeated(
         self, ctx: RunContext, strategy_change: Any, *, runner: Optional[Callable] = None
     ) -> bool:
@@ -401,7 +498,13 @@ class BasePlaybook:
         if not isinstance(event, str) or not event or event in self.RESERVED_EVENTS:
             return False
         try:
-            allowed = {e.id for e in self.sm.allowed_events}
+            value = self.sm.current_state_value
+            # A compound configuration is an (unhashable) set of states, not a
+            # state id — the table cannot answer it, so ask the machine.
+            if isinstance(value, str) and value in (table := _transition_table(type(self.sm))):
+                allowed = table[value]
+            else:
+                allowed = frozenset(e.id for e in self.sm.allowed_events)
         except Exception:  # noqa: BLE001 — unknown machine introspection failure
             return False
         if event not in allowed:
@@ -550,7 +653,9 @@ class BasePlaybook:
             # as a parseable error directive, not a raw traceback the driver
             # cannot read.
             return self._to_error(f"start failed: {exc}")
-        self._save(STATUS_RUNNING, entry)
+        # No checkpoint here: every exit of _advance_to (dispatch, gate, escalation,
+        # tool-state run, terminal) persists the run, and after run_start — so the
+        # advanced obs seq is captured by that single write.
         self.obs.run_start(ctx)
         return self._advance_to(entry)
 
@@ -558,7 +663,9 @@ class BasePlaybook:
         rec = self.cp.load(run_id)
         if rec is None:
             return self._plain_error(session_id, run_id, f"unknown run_id '{run_id}'")
-        self.ctx = rec.context
+        # Bind the rehydrated context once for the rest of the step instead of
+        # going through the checked ``_ctx`` property / ``self.ctx`` on every use.
+        self.ctx = ctx = rec.context
         self.sm = self.machine_cls()
         try:
             self.sm.current_state_value = rec.current_state_id
@@ -576,14 +683,14 @@ class BasePlaybook:
             return self._plain_error(session_id, run_id, f"run already terminal ({state})")
 
         # Global step-cap budget.
-        self.ctx.total_steps += 1
-        if self.ctx.total_steps > self.STEP_CAP:
+        ctx.total_steps += 1
+        if ctx.total_steps > self.STEP_CAP:
             return self._to_error(f"global step cap ({self.STEP_CAP}) exceeded")
 
         # Parallel fan-out states buffer per-branch SUMMARYs and route once on
         # fan-in (see _step_parallel).
         try:
-            pspec = self.parallel_spec(state, self._ctx)
+            pspec = self.parallel_spec(state, ctx)
         except Exception as exc:
             return self._to_error(f"fan-out spec error at '{state}': {exc}")
         if pspec is not None:
@@ -622,7 +729,7 @@ class BasePlaybook:
             return self._retry_malformed(state, f"invalid SUMMARY: {err}")
 
         # A well-formed SUMMARY: retry budget resets.
-        self.ctx.step_retries = 0
+        ctx.step_retries = 0
         self._capture_evidence(summary)
         confidence = summary.get("confidence", "")
 
@@ -634,7 +741,7 @@ class BasePlaybook:
         # before routing — e.g. a retry whose strategy is unchanged, or repeated
         # no-progress iterations. Only escalatable states can reach the HITL path;
         # the reason overrides the escalation's unknown_reason.
-        stall_reason = self.progress_check(state, self.ctx, summary)
+        stall_reason = self.progress_check(state, ctx, summary)
         if stall_reason and state in self.ESCALATABLE_STATES:
             return self._escalate(state, spec, {**summary, "unknown_reason": stall_reason})
 
@@ -644,34 +751,35 @@ class BasePlaybook:
             digest["verdict"] = summary["verdict"]
         if "gaps" in summary and isinstance(summary["gaps"], list):
             digest["gaps_count"] = len(summary["gaps"])
-        self.obs.step_end(self.ctx, spec.name, digest, confidence)
+        self.obs.step_end(ctx, spec.name, digest, confidence)
 
         # Route (subclass fires the FSM event(s)).
-        pre_iteration = self._ctx.iteration
+        pre_iteration = ctx.iteration
         try:
-            self.route_after(state, self._ctx, summary)
+            self.route_after(state, ctx, summary)
         except Exception as exc:
             return self._to_error(f"routing error at '{state}': {exc}")
         self._auto_record_iteration(pre_iteration, summary)
 
         new_state = self.sm.current_state_value
-        self.obs.transition(self.ctx, state, new_state, event="route")
+        self.obs.transition(ctx, state, new_state, event="route")
 
         if new_state in TERMINAL_STATES:
             return self._finish(new_state)
-        if self._ctx.iteration > self._ctx.max_iterations:
+        if ctx.iteration > ctx.max_iterations:
             return self._force_exhausted(new_state)
         return self._advance_to(new_state)
 
     def status(self, *, session_id: str, run_id: str) -> dict:
-        rec = self.cp.load(run_id)
-        if rec is None:
+        found = self.cp.load_status(run_id)
+        if found is None:
             return Directives.status(
                 state="unknown", complete=False, session_id=session_id, run_id=run_id
             )
+        state_id, status = found
         return Directives.status(
-            state=rec.current_state_id,
-            complete=rec.status in (STATUS_COMPLETE, STATUS_ERROR),
+            state=state_id,
+            complete=status in TERMINAL_STATUSES,
             session_id=session_id,
             run_id=run_id,
         )
@@ -710,18 +818,25 @@ class BasePlaybook:
         width, the model spends it. Raises ``ValueError`` on malformed branch
         data or an over-width fan (call sites surface a parseable error
         directive)."""
-        dynamic = (ctx.extras.get("dynamic_branches") or {}).get(state) if ctx else None
-        spec = parallel_spec_from_dict(dynamic) if dynamic else self.PARALLEL_BY_STATE.get(state)
-        if spec is not None:
-            try:
-                width_cap = int(ctx.constraints.get("max_fan_width", _DEFAULT_MAX_FAN_WIDTH))
-            except (TypeError, ValueError):
-                width_cap = _DEFAULT_MAX_FAN_WIDTH
-            if len(spec.branches) > width_cap:
-                raise ValueError(
-                    f"fan-out at '{state}' has {len(spec.branches)} branches, over the "
-                    f"max_fan_width budget ({width_cap})"
-                )
+        dynamic_by_state = ctx.extras.get("dynamic_branches") if ctx else None
+        dynamic = dynamic_by_state.get(state) if dynamic_by_state else None
+        if dynamic:
+            spec = parallel_spec_from_dict(dynamic)
+        else:
+            spec = self.PARALLEL_BY_STATE.get(state)
+            if spec is None:
+                # The common case — a single-agent state in a run that never
+                # emitted dynamic branches: no fan-out, no budget to resolve.
+                return None
+        try:
+            width_cap = int(ctx.constraints.get("max_fan_width", _DEFAULT_MAX_FAN_WIDTH))
+        except (TypeError, ValueError):
+            width_cap = _DEFAULT_MAX_FAN_WIDTH
+        if len(spec.branches) > width_cap:
+            raise ValueError(
+                f"fan-out at '{state}' has {len(spec.branches)} branches, over the "
+                f"max_fan_width budget ({width_cap})"
+            )
         return spec
 
     def _capture_evidence(self, summary: dict) -> None:
@@ -734,7 +849,7 @@ class BasePlaybook:
         if isinstance(ev, (list, tuple)) and len(ev) > 0:
             self._ctx.verify_evidence = [
                 s if len(s) <= 300 else s[:300] + " …[truncated]"
-                for s in (str(e) for e in list(ev)[:5])
+                for s in (str(e) for e in ev[:_EVIDENCE_KEEP])
             ]
 
     def _auto_record_iteration(self, pre_iteration: int, summary: dict) -> None:
@@ -746,16 +861,24 @@ class BasePlaybook:
         ctx = self._ctx
         if ctx.iteration <= pre_iteration:
             return
-        if any(e.get("iteration") == pre_iteration for e in ctx.iteration_history):
-            return
+        # Digests are appended in iteration order, so a playbook-recorded digest
+        # for ``pre_iteration`` sits at the tail: scan newest-first and stop at
+        # the first older iteration instead of re-scanning the whole history.
+        for entry in reversed(ctx.iteration_history):
+            recorded = entry.get("iteration")
+            if recorded == pre_iteration:
+                return
+            if isinstance(recorded, int) and recorded < pre_iteration:
+                break
         gaps = summary.get("gaps")
-        ctx.iteration_history.append(
+        self._append_iteration(
+            ctx,
             {
                 "iteration": pre_iteration,
                 "strategy_change": self._norm_text(summary.get("strategy_change", "")),
                 "gaps": [self._norm_text(g) for g in (gaps if isinstance(gaps, list) else [])],
                 "confidence": summary.get("confidence", ""),
-            }
+            },
         )
 
     def _force_exhausted(self, state: str) -> dict:
@@ -826,30 +949,17 @@ class BasePlaybook:
             return ""
         if not _needs_summary_restatement():  # #28: strong tier doesn't need the crutch
             return ""
-        contract = getattr(spec, "summary_contract", None) or {}
-        required = contract.get("required", {}) or {}
-        optional = contract.get("optional", {}) or {}
-        if not required and not optional:
+        contract = getattr(spec, "summary_contract", None)
+        if not contract:
             return ""
-        placeholder = {bool: "<true|false>", int: "<int>", str: "<string>", list: "<[...]>"}
-
-        def _render(fields: dict) -> str:
-            return ", ".join(
-                f'"{key}": {placeholder.get(typ, "<value>")}' for key, typ in fields.items()
-            )
-
-        rendered = [chunk for chunk in (_render(required), _render(optional)) if chunk]
-        schema = "{" + ", ".join(rendered) + "}"
-        req_keys = ", ".join(required.keys()) or "(none)"
-        return (
-            "\n\nOUTPUT FORMAT — this is the FINAL and most important directive; obey it exactly.\n"
-            "Your response MUST end with ONE line: `SUMMARY:` immediately followed by a single-line "
-            "JSON object with these EXACT keys. Replace every `<...>` placeholder with a real value "
-            "from your work and output valid JSON (booleans true/false and numbers unquoted, strings "
-            f"quoted, arrays in []). Required keys (must be present): {req_keys}. Emit NOTHING after "
-            "that line.\n"
-            f"SUMMARY:{schema}"
-        )
+        cached = _SCHEMA_DIRECTIVES.get(id(contract))
+        if cached is not None and cached[0] is contract:
+            return cached[1]
+        text = _render_summary_schema(contract)
+        if len(_SCHEMA_DIRECTIVES) >= _SCHEMA_DIRECTIVES_MAX:
+            _SCHEMA_DIRECTIVES.clear()
+        _SCHEMA_DIRECTIVES[id(contract)] = (contract, text)
+        return text
 
     def _advance_to(self, state: str) -> dict:  # noqa: C901
         """Emit step_start (advancing the seq), then CHECKPOINT so the advanced
@@ -892,7 +1002,7 @@ class BasePlaybook:
             for b in pspec.branches.values():
                 self.obs.step_start(self.ctx, b.name, b.agent, state)
             self._save(STATUS_RUNNING, state)
-            return self._directive_for_state(state)
+            return self._directive_for_state(state, pspec=pspec)
         spec = self.PRIMITIVE_BY_STATE.get(state)
         if spec is None:
             return self._to_error(f"no primitive registered for state '{state}'")
@@ -914,24 +1024,30 @@ class BasePlaybook:
                     )
         self.obs.step_start(self.ctx, spec.name, spec.agent, state)
         self._save(STATUS_RUNNING, state)
-        return self._directive_for_state(state)
+        return self._directive_for_state(state, pspec=None)
 
     def autonomy_action(self, state: str, ctx: RunContext) -> str:
         """The action text the autonomy gate classifies for ``state``. Default: the
         run's goal (the action being taken). Subclasses may refine per state."""
         return ctx.goal
 
-    def _directive_for_state(self, state: str) -> dict:
+    def _directive_for_state(self, state: str, *, pspec: Any = _UNRESOLVED) -> dict:
         """Pure directive builder (no emission, no checkpoint) — safe for the
         auto-recovery scan to re-issue a pending step. For a parallel state it
         re-issues the whole fan-out (all branches), so a kill-and-resume re-runs
-        every branch (branch agents must be idempotent)."""
+        every branch (branch agents must be idempotent).
+
+        ``_advance_to`` has already resolved the fan-out topology for ``state``
+        and passes it as ``pspec`` (``None`` for a single-agent state), so a
+        forward transition does not re-read (and, for dynamic branches, re-parse)
+        it; the recovery scan omits it and it is resolved here."""
         sc = self.skill_context(state, self.ctx)
         model = self.model_for_state(state, self.ctx)
-        try:
-            pspec = self.parallel_spec(state, self._ctx)
-        except Exception as exc:
-            return self._to_error(f"fan-out spec error at '{state}': {exc}")
+        if pspec is _UNRESOLVED:
+            try:
+                pspec = self.parallel_spec(state, self._ctx)
+            except Exception as exc:
+                return self._to_error(f"fan-out spec error at '{state}': {exc}")
         if pspec is not None:
             tasks = []
             for bid, b in pspec.branches.items():
@@ -1013,20 +1129,26 @@ class BasePlaybook:
                 )
             branches[bid] = summary
 
-        missing = set(pspec.branches) - set(branches)
-        if missing:
-            return self._retry_or_fail(
-                state, f"parallel '{state}': missing branches {sorted(missing)}"
-            )
+        # Every key in ``branches`` was checked against ``pspec.branches`` above,
+        # so equal counts mean full coverage; the set difference is only built
+        # to name the gap on the failure path.
+        if len(branches) != len(pspec.branches):
+            missing = sorted(set(pspec.branches) - set(branches))
+            return self._retry_or_fail(state, f"parallel '{state}': missing branches {missing}")
 
         self.ctx.step_retries = 0
+        # Only the first _EVIDENCE_KEEP items survive _capture_evidence, so stop
+        # collecting (and stringifying) once that many are in hand.
         merged_evidence: list[Any] = []
         for s in branches.values():
+            room = _EVIDENCE_KEEP - len(merged_evidence)
+            if room <= 0:
+                break
             ev = s.get("evidence")
             if isinstance(ev, str) and ev.strip():
                 merged_evidence.append(ev)
             elif isinstance(ev, (list, tuple)):
-                merged_evidence.extend(str(e) for e in ev)
+                merged_evidence.extend(str(e) for e in ev[:room])
         if merged_evidence:
             self._capture_evidence({"evidence": merged_evidence})
         for bid, s in branches.items():
@@ -1213,6 +1335,19 @@ class BasePlaybook:
         )
 
     def _safe_send(self, event: str) -> bool:
+        """Fire ``event``; False (FSM unmoved) when it cannot fire. An event the
+        current state does not declare is rejected from the transition table —
+        the engine probes edges speculatively (``abort`` on error, the
+        ``to_unknown``/``escalate`` pair, model-chosen routes), and a
+        TransitionNotAllowed raise + unwind per miss is the expensive way to
+        learn that. Anything else (guards, callbacks) still goes through
+        ``send`` and is caught."""
+        try:
+            allowed = _transition_table(type(self.sm)).get(self.sm.current_state_value)
+        except Exception:  # noqa: BLE001 — unknown machine introspection failure
+            allowed = None
+        if allowed is not None and event not in allowed:
+            return False
         try:
             self.sm.send(event)
             return True
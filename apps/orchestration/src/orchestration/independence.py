@@ -34,6 +34,7 @@ consumes (repay by adopting jsa's ``reverify_model`` cross-model hook and measur
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -51,11 +52,26 @@ def agent_model(agent: str, agents_dir: Path | str = _AGENTS_DIR) -> str:
     Fail-loud: a missing agent file or missing ``model:`` line raises — the invariant must never
     silently treat an unresolvable agent as 'independent'."""
     path = Path(agents_dir) / f"{agent}.md"
-    text = path.read_text(encoding="utf-8")
-    match = re.search(r"(?m)^model:[ \t]*(\S+)[ \t]*$", text)
-    if not match:
-        raise ValueError(f"no 'model:' frontmatter in {path}")
-    return match.group(1).strip()
+    st = path.stat()
+    return _model_from_file(str(path), st.st_mtime_ns, st.st_size)
+
+
+_MODEL_LINE_RE = re.compile(r"(?m)^model:[ \t]*(\S+)[ \t]*$")
+
+
+@functools.lru_cache(maxsize=64)
+def _model_from_file(path: str, mtime_ns: int, size: int) -> str:
+    """Parse one agent file's ``model:`` line. Keyed on (path, mtime, size): a sweep over every
+    edge re-asks for the same few agents, while an edited file still re-reads (stays LIVE).
+
+    Streams lines and stops at the first ``model:`` (it sits in the frontmatter), so the agent's
+    prompt body is never read."""
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            match = _MODEL_LINE_RE.search(line)
+            if match:
+                return match.group(1).strip()
+    raise ValueError(f"no 'model:' frontmatter in {path}")
 
 
 @dataclass(frozen=True)
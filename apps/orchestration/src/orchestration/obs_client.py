@@ -105,6 +105,7 @@ class ObsClient:
         primitive: str | None = None,
         agent: str | None = None,
         data: dict[str, Any] | None = None,
+        timestamp: str | None = None,
     ) -> bool:
         return self._post(
             "/orchestration/events",
@@ -119,7 +120,7 @@ class ObsClient:
                         "primitive": primitive,
                         "agent": agent,
                         "data": data or {},
-                        "timestamp": _now(),
+                        "timestamp": timestamp or _now(),
                     }
                 ]
             },
@@ -127,6 +128,8 @@ class ObsClient:
 
     # -- lifecycle emitters (digests only) --------------------------------
     def run_start(self, ctx: "RunContext") -> None:
+        # One clock read for the run row and its run_start event: same instant.
+        now = _now()
         self._post(
             "/orchestration/runs",
             {
@@ -135,10 +138,12 @@ class ObsClient:
                 "playbook": ctx.playbook,
                 "goal": ctx.goal,
                 "status": "running",
-                "started_at": _now(),
+                "started_at": now,
             },
         )
-        self._event(ctx, "run_start", data={"playbook": ctx.playbook, "goal": ctx.goal})
+        self._event(
+            ctx, "run_start", data={"playbook": ctx.playbook, "goal": ctx.goal}, timestamp=now
+        )
 
     def step_start(self, ctx: "RunContext", primitive: str, agent: str, state_id: str) -> None:
         self._event(
@@ -182,18 +187,24 @@ class ObsClient:
         )
 
     def run_end(self, ctx: "RunContext", status: str, met: bool, iterations: int) -> None:
+        now = _now()
         self._post(
             "/orchestration/runs",
             {
                 "run_id": ctx.run_id,
                 "session_id": ctx.session_id,
                 "status": status,
-                "ended_at": _now(),
+                "ended_at": now,
                 "met": met,
                 "iterations": iterations,
             },
         )
-        self._event(ctx, "run_end", data={"status": status, "met": met, "iterations": iterations})
+        self._event(
+            ctx,
+            "run_end",
+            data={"status": status, "met": met, "iterations": iterations},
+            timestamp=now,
+        )
 
 
 def reset_circuit_breaker() -> None:
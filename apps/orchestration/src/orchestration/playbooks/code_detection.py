@@ -42,6 +42,11 @@ _TS_SERVER_DEPS: dict[str, list[str]] = {
     "nestjs": ["@nestjs/core", "@nestjs/common"],
 }
 
+# Vendored / generated trees skipped by the source-import scans. Matched against
+# path COMPONENTS (a set probe per part), not a substring of the stringified path —
+# that allocated a str per file and also skipped e.g. ``src/my__pycache__util.py``.
+_VENDORED_DIRS = frozenset({"node_modules", "__pycache__"})
+
 
 # ── #9: model-first server-framework detection (tables are the fallback) ──────
 # The dep tables above miss any framework they don't enumerate (e.g. hono) — the
@@ -401,7 +406,7 @@ def _detect_ai_framework(project_root: str) -> dict:  # noqa: C901
     # Also scan source files for direct import statements
     for pattern in ("**/*.py", "**/*.ts", "**/*.tsx"):
         for src in root.glob(pattern):
-            if "__pycache__" in str(src) or "node_modules" in str(src):
+            if not _VENDORED_DIRS.isdisjoint(src.parts):
                 continue
             try:
                 content = src.read_text(encoding="utf-8").lower()
@@ -511,7 +516,7 @@ def _detect_web_ui_framework(project_root: str) -> dict:  # noqa: C901
     )
     for pattern in ("**/*.ts", "**/*.js", "**/*.mjs", "**/*.tsx", "**/*.jsx"):
         for src in root.glob(pattern):
-            if "node_modules" in str(src) or "__pycache__" in str(src):
+            if not _VENDORED_DIRS.isdisjoint(src.parts):
                 continue
             try:
                 content = src.read_text(encoding="utf-8").lower()
@@ -40,6 +40,7 @@ concern (reviewer ≠ author model) attaches to whatever authored the content.
 
 from __future__ import annotations
 
+import heapq
 import importlib.util
 import json
 import math
@@ -612,11 +613,11 @@ def _build_pairings(
     pairings: list[dict] = []
     for section in content_outline:
         st = _tokset(section)
-        scored = [(len(st & toks), sid) for sid, toks in src_tokens if st & toks]
-        scored.sort(key=lambda x: (-x[0], x[1]))
-        pairings.append(
-            {"section": section, "candidate_sources": [sid for _, sid in scored[:max_candidates]]}
-        )
+        scored = [(n, sid) for sid, toks in src_tokens if (n := len(st & toks))]
+        # Bounded top-k (same order as a full sort + slice) — only a handful of
+        # candidates survive per section, however many sources the corpus holds.
+        top = heapq.nsmallest(max_candidates, scored, key=lambda x: (-x[0], x[1]))
+        pairings.append({"section": section, "candidate_sources": [sid for _, sid in top]})
     return pairings
 
 
@@ -212,8 +212,7 @@ INTAKE_SCHEMA: list[dict] = [
         "label": "Target URL",
         "prompt": "What is the target URL for the security analysis?",
         "options": [],
-        "validate": lambda v: isinstance(v, str)
-        and (v.startswith("http://") or v.startswith("https://")),
+        "validate": lambda v: isinstance(v, str) and v.startswith(("http://", "https://")),
     },
     {
         "key": "authenticated_testing",
@@ -8,10 +8,13 @@ imports no agent-side capability. See pack 06-technical-reference.md §10.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 
+from ..contracts import EMPTY_MAPPING
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PrimitiveSpec:
     name: str  # canonical uppercase name, e.g. "FRAME"
     agent: str  # default driver agent, e.g. "annie"
@@ -34,7 +37,7 @@ def contract_from_json(contract: dict) -> dict:
     """
     out: dict = {}
     for section in ("required", "optional"):
-        fields = contract.get(section, {}) or {}
+        fields = contract.get(section) or EMPTY_MAPPING
         converted: dict[str, type] = {}
         for key, tname in fields.items():
             if tname not in _TYPE_BY_NAME:
@@ -76,7 +79,7 @@ def parallel_spec_from_dict(branches: dict) -> "ParallelSpec":
     return ParallelSpec(branches=specs)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParallelSpec:
     """Descriptor of a fan-out state: every branch's agent is dispatched
     concurrently (one ``invoke_agents_parallel`` directive). The driver spawns one
@@ -86,4 +89,6 @@ class ParallelSpec:
     buffered on the context. Each branch reuses a PrimitiveSpec so it gets its own
     agent, contract, and task hint."""
 
-    branches: dict[str, PrimitiveSpec] = field(default_factory=dict)  # branch_id -> spec
+    # branch_id -> spec. A frozen spec never mutates its branches, so the default
+    # hands back the shared read-only empty mapping instead of a fresh dict.
+    branches: Mapping[str, PrimitiveSpec] = field(default_factory=lambda: EMPTY_MAPPING)
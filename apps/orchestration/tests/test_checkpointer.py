@@ -5,6 +5,7 @@ object (a new process would do the same) returns an identical context + state
 id — no argv blob, no transition replay.
 """
 
+import shutil
 import time
 from datetime import datetime, timedelta, timezone
 
@@ -52,6 +53,23 @@ def test_save_then_load_in_fresh_object(db_path):
     assert rec.context == ctx  # identical RunContext round-trip
 
 
+def test_context_json_is_compact(db_path):
+    import sqlite3
+
+    cp = Checkpointer(db_path=db_path)
+    cp.save(
+        run_id="run-1",
+        session_id="sess-1",
+        playbook="reference-cycle",
+        current_state_id="verifying",
+        context=_ctx(goal="a: b, c"),
+        status=STATUS_RUNNING,
+    )
+    raw = sqlite3.connect(db_path).execute("SELECT context_json FROM runs").fetchone()[0]
+    assert '"goal":"a: b, c"' in raw and '", "' not in raw
+    assert cp.load("run-1").context.goal == "a: b, c"
+
+
 def test_load_missing_returns_none(db_path):
     cp = Checkpointer(db_path=db_path)
     assert cp.load("nope") is None
@@ -83,6 +101,30 @@ def test_upsert_preserves_created_at_updates_updated_at(db_path):
     assert second.current_state_id == "acting"
 
 
+def test_db_dir_recreated_after_removal(tmp_path):
+    db = tmp_path / "nested" / "orchestration.db"
+    Checkpointer(db_path=db)
+    shutil.rmtree(db.parent)
+    Checkpointer(db_path=db).save(
+        run_id="r",
+        session_id="s",
+        playbook="p",
+        current_state_id="acting",
+        context=_ctx(run_id="r"),
+        status=STATUS_RUNNING,
+    )
+
+
+def test_identical_resave_wins_over_another_writer(db_path):
+    cp = Checkpointer(db_path=db_path)
+    ctx = _ctx(run_id="r")
+    kw = dict(run_id="r", session_id="s", playbook="p", status=STATUS_RUNNING)
+    cp.save(context=ctx, current_state_id="acting", **kw)
+    Checkpointer(db_path=db_path).save(context=ctx, current_state_id="verifying", **kw)
+    cp.save(context=ctx, current_state_id="acting", **kw)
+    assert cp.load("r").current_state_id == "acting"
+
+
 def test_list_pending_only_resumable(db_path):
     cp = Checkpointer(db_path=db_path)
     cp.save(
@@ -124,6 +166,48 @@ def test_list_pending_only_resumable(db_path):
     assert cp.list_pending(session_id="nope") == []
 
 
+def test_list_pending_session_scan_uses_composite_index(db_path):
+    import sqlite3
+
+    Checkpointer(db_path=db_path)
+    conn = sqlite3.connect(str(db_path))
+    try:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM runs WHERE status IN (?, ?) AND session_id = ? "
+            "ORDER BY updated_at ASC, rowid ASC",
+            ("running", "awaiting_user", "s"),
+        ).fetchall()
+    finally:
+        conn.close()
+    assert any("idx_runs_session_status" in row[-1] for row in plan)
+
+
+def test_schema_drops_superseded_single_column_indexes(db_path):
+    import sqlite3
+
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(
+        "CREATE TABLE runs (run_id TEXT PRIMARY KEY, session_id TEXT NOT NULL,"
+        " playbook TEXT NOT NULL, current_state_id TEXT NOT NULL, context_json TEXT NOT NULL,"
+        " status TEXT NOT NULL, created_at TEXT, updated_at TEXT);"
+        "CREATE INDEX idx_runs_session ON runs(session_id);"
+        "CREATE INDEX idx_runs_status ON runs(status);"
+    )
+    conn.close()
+    Checkpointer(db_path=db_path)
+    conn = sqlite3.connect(str(db_path))
+    try:
+        names = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+            )
+        }
+    finally:
+        conn.close()
+    assert names == {"idx_runs_status_updated", "idx_runs_session_status"}
+
+
 def test_purge_older_than_only_terminal(db_path, monkeypatch):
     cp = Checkpointer(db_path=db_path)
     # Insert rows, then rewrite updated_at to be old for two of them.
@@ -443,6 +443,14 @@ def test_detect_web_ui_lit_by_source_import(tmp_path: Path) -> None:
     assert info["frameworks"] == ["lit"]
 
 
+def test_detect_web_ui_skips_vendored_dirs_by_component(tmp_path: Path) -> None:
+    """node_modules is skipped as a path component; a file merely NAMED like it is not."""
+    _write(tmp_path / "node_modules" / "x" / "index.ts", 'import { html } from "lit";')
+    assert code_detection._detect_web_ui_framework(str(tmp_path)) == {"is_web_ui": False}
+    _write(tmp_path / "src" / "node_modules_shim.ts", 'import { html } from "lit";')
+    assert code_detection._detect_web_ui_framework(str(tmp_path))["frameworks"] == ["lit"]
+
+
 def test_detect_web_ui_tailwind_in_package_json(tmp_path: Path) -> None:
     """tailwindcss in package.json marks the project as a web UI."""
     pkg = {"name": "site", "devDependencies": {"tailwindcss": "^4.0.0"}}
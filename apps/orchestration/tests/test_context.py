@@ -109,6 +109,11 @@ def test_from_dict_missing_required_raises():
         RunContext.from_dict({"run_id": "r", "playbook": "p"})  # no session_id
 
 
+def test_from_dict_names_the_missing_required_key():
+    with pytest.raises(ValueError, match="missing required key: 'playbook'"):
+        RunContext.from_dict({"session_id": "s", "run_id": "r", "goal": "g"})
+
+
 def test_from_dict_non_dict_raises():
     with pytest.raises(TypeError):
         RunContext.from_dict(["not", "a", "dict"])
@@ -121,3 +126,11 @@ def test_mutable_defaults_are_independent():
     a.success_criteria.append("c")
     assert b.errors == []
     assert b.success_criteria == []
+
+
+def test_undeclared_attribute_is_rejected():
+    # slotted: a typo'd field write fails loudly instead of silently never checkpointing
+    ctx = RunContext(session_id="s", run_id="r", playbook="p")
+    assert not hasattr(ctx, "__dict__")
+    with pytest.raises(AttributeError):
+        ctx.iteraton = 2
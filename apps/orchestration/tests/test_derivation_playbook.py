@@ -28,6 +28,7 @@ from orchestration.playbooks import derivation as deriv
 from orchestration.playbooks.derivation import (
     REVIEW_CONTRACT,
     DerivationPlaybook,
+    _build_pairings,
     build_provenance_content,
 )
 
@@ -690,3 +691,15 @@ def test_outline_cli_emits_json(tmp_path):
     assert report["status"] == "ok"
     assert report["section_count"] == 2
     assert [s["title"] for s in report["sections"]] == ["One", "Two"]
+
+
+def test_pairings_keep_top_overlap_with_id_tiebreak():
+    entries = [
+        {"id": "src-c", "outline": ["gradient descent"]},
+        {"id": "src-a", "outline": ["gradient descent"]},
+        {"id": "src-b", "outline": ["stochastic gradient descent steps"]},
+        {"id": "src-z", "outline": ["unrelated heading"]},
+        {"id": "src-d", "outline": ["descent"]},
+    ]
+    [pairing] = _build_pairings(["Stochastic gradient descent"], entries)
+    assert pairing["candidate_sources"] == ["src-b", "src-a", "src-c"]
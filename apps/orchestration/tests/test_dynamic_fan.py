@@ -63,6 +63,12 @@ def test_parallel_spec_from_dict_builds_branches():
     assert spec.branches["b2"].summary_contract["required"] == {"ok": bool}
 
 
+def test_spec_descriptors_are_slotted():
+    spec = parallel_spec_from_dict({"b1": {"agent": "skribble"}})
+    assert not hasattr(spec, "__dict__")
+    assert not hasattr(spec.branches["b1"], "__dict__")
+
+
 def test_parallel_spec_from_dict_requires_agent():
     with pytest.raises(ValueError, match="missing required 'agent'"):
         parallel_spec_from_dict({"b1": {"task_hint": "no agent"}})
@@ -258,3 +264,81 @@ def test_static_parallel_by_state_still_works_via_seam(cp):
     )
     assert d["action"] == "invoke_agents_parallel"
     assert {t["branch_id"] for t in d["tasks"]} == {"s1"}
+
+
+def test_forward_advance_resolves_the_fan_spec_once(cp, monkeypatch):
+    """_advance_to hands its resolved topology to the directive builder instead
+    of re-parsing the dynamic branches a second time."""
+    calls = []
+    real = FanPlaybook.parallel_spec
+
+    def counting(self, state, ctx):
+        calls.append(state)
+        return real(self, state, ctx)
+
+    monkeypatch.setattr(FanPlaybook, "parallel_spec", counting)
+    d = _plan(cp)
+    assert d["action"] == "invoke_agents_parallel"
+    assert calls.count("fanning") == 1
+
+
+def test_fan_in_with_a_missing_branch_reissues_the_fan_out(cp):
+    _plan(cp)
+    results = [
+        {
+            "branch_id": "part1",
+            "agent": "skribble",
+            "exitCode": 0,
+            "summary": {"done": True, "confidence": "CERTAIN"},
+        },
+    ]
+    d = FanPlaybook(cp).step(session_id=SID, run_id=RID, agent="__parallel__", result=results)
+    assert d["action"] == "invoke_agents_parallel"
+    rec = cp.load(RID)
+    assert rec.context.step_retries == 1
+
+
+def test_empty_defaults_share_one_read_only_mapping():
+    from orchestration.contracts import EMPTY_MAPPING
+    from orchestration.primitives.spec import ParallelSpec
+
+    assert ParallelSpec().branches is EMPTY_MAPPING
+    with pytest.raises(TypeError):
+        ParallelSpec().branches["x"] = None  # type: ignore[index]
+    assert contract_from_json({}) == {"required": {}, "optional": {}}
+
+
+def test_single_agent_state_skips_fan_out_resolution(cp):
+    from orchestration.context import RunContext
+
+    ctx = RunContext(session_id=SID, run_id=RID, playbook="fan-test")
+    ctx.constraints["max_fan_width"] = "not-a-number"
+    ctx.extras["dynamic_branches"] = {"fanning": SUBTASKS}
+    pb = FanPlaybook(cp)
+    assert pb.parallel_spec("planning", ctx) is None
+    assert set(pb.parallel_spec("fanning", ctx).branches) == {"part1", "part2"}
+
+
+def test_fan_in_keeps_only_the_first_evidence_items(cp):
+    _plan(cp)
+    results = [
+        {
+            "branch_id": bid,
+            "agent": "skribble",
+            "exitCode": 0,
+            "summary": {
+                "done": True,
+                "confidence": "CERTAIN",
+                "evidence": [f"{bid}-e{i}" for i in range(4)],
+            },
+        }
+        for bid in ("part1", "part2")
+    ]
+    FanPlaybook(cp).step(session_id=SID, run_id=RID, agent="__parallel__", result=results)
+    assert cp.load(RID).context.verify_evidence == [
+        "part1-e0",
+        "part1-e1",
+        "part1-e2",
+        "part1-e3",
+        "part2-e0",
+    ]
@@ -352,6 +352,23 @@ def test_status_reports_state(cp):
     assert d["action"] == "status" and d["state"] == "observing" and d["complete"] is False
 
 
+def test_status_does_not_rehydrate_context(cp, monkeypatch):
+    _start(cp)
+    monkeypatch.setattr(cp, "load", lambda run_id: pytest.fail("status decoded the context"))
+    d = ReferenceCycle(cp, None).status(session_id=SID, run_id=RID)
+    assert d["state"] == "observing"
+    assert ReferenceCycle(cp, None).status(session_id=SID, run_id="ghost")["state"] == "unknown"
+
+
+def test_start_checkpoints_once(cp, monkeypatch):
+    saves = []
+    real = cp.save
+    monkeypatch.setattr(cp, "save", lambda **kw: (saves.append(kw["current_state_id"]), real(**kw)))
+    _start(cp)
+    assert saves == ["observing"]
+    assert cp.load(RID).context.last_seq >= 0
+
+
 def test_global_step_cap_terminates(cp, monkeypatch):
     # Force a tiny cap and a bad summary so the run keeps retrying the same
     # state; the global step cap must eventually route to error.
@@ -17,7 +17,7 @@
 
 import json
 
-from statemachine import State, StateMachine
+from statemachine import State, StateChart, StateMachine
 
 from orchestration.checkpointer import Checkpointer
 from orchestration.context import RunContext
@@ -258,6 +258,18 @@ def test_auto_record_dedupes_playbook_recorded_iterations(tmp_path):
     assert len(rec.context.iteration_history) == 1  # not double-recorded
 
 
+def test_auto_record_checks_only_the_recent_tail(tmp_path):
+    pb = RetryPlaybook(Checkpointer(db_path=tmp_path / "orch.db"))
+    pb.ctx = RunContext(session_id=SID, run_id=RID, playbook="retry-test")
+    pb.ctx.iteration_history = [{"iteration": i, "gaps": []} for i in range(3)]
+    pb.ctx.iteration = 3
+    pb._auto_record_iteration(2, {"gaps": ["g"]})  # already recorded -> no-op
+    assert len(pb.ctx.iteration_history) == 3
+    pb.ctx.iteration = 4
+    pb._auto_record_iteration(3, {"gaps": ["g"]})  # new -> appended
+    assert [e["iteration"] for e in pb.ctx.iteration_history] == [0, 1, 2, 3]
+
+
 # ---------------------------------------------------------------------------
 # R8 — model-owned routing (fire_model_route)
 # ---------------------------------------------------------------------------
@@ -368,3 +380,50 @@ def test_fire_model_route_returns_false_unmoved(tmp_path):
     assert pb.sm.current_state_value == "deciding"
     assert pb.fire_model_route({"next_event": "choose_a"}) is True
     assert pb.sm.current_state_value == "path_a"
+
+
+class CompoundMachine(StateChart):
+    class working(State.Compound):
+        drafting = State(initial=True)
+        reviewing = State()
+        review = drafting.to(reviewing)
+
+    complete = State(final=True)
+    error = State(final=True)
+
+    finish = working.to(complete)
+    abort = working.to(error)
+
+
+def test_fire_model_route_in_compound_configuration(tmp_path):
+    pb = DialPlaybook(Checkpointer(db_path=tmp_path / "orch.db"))
+    pb.sm = CompoundMachine()
+    assert not isinstance(pb.sm.current_state_value, str)  # a set of active states
+    assert pb.fire_model_route({"next_event": "bogus"}) is False
+    assert pb.fire_model_route({"next_event": "review"}) is True
+    assert "reviewing" in {s.id for s in pb.sm.configuration}
+    assert pb.fire_model_route({"next_event": "finish"}) is True
+    assert pb.sm.current_state_value == "complete"
+
+
+def test_transition_table_matches_machine_allowed_events():
+    from orchestration.engine import _transition_table
+
+    table = _transition_table(DialMachine)
+    assert _transition_table(DialMachine) is table  # built once per machine class
+    sm = DialMachine()
+    for state_id in ("intake", "deciding", "path_a"):
+        sm.current_state_value = state_id
+        assert table[state_id] == frozenset(e.id for e in sm.allowed_events)
+
+
+def test_safe_send_rejects_undeclared_events_without_raising(tmp_path, monkeypatch):
+    pb = DialPlaybook(Checkpointer(db_path=tmp_path / "orch.db"))
+    pb.sm = DialMachine()
+    sent = []
+    real_send = pb.sm.send
+    monkeypatch.setattr(pb.sm, "send", lambda e: (sent.append(e), real_send(e)))
+    assert pb._safe_send("finish") is False  # not declared out of intake
+    assert sent == []  # rejected from the table, never raised inside send
+    assert pb._safe_send("start") is True
+    assert pb.sm.current_state_value == "deciding"
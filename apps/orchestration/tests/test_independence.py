@@ -44,6 +44,21 @@ def test_agent_model_is_fail_loud_on_unknown_agent():
     raise AssertionError("agent_model must raise on an unresolvable agent, never assume independence")
 
 
+def test_agent_model_follows_file_edits(tmp_path):
+    agent = tmp_path / "probe.md"
+    agent.write_text("---\nmodel: sonnet\n---\n", encoding="utf-8")
+    assert ind.agent_model("probe", tmp_path) == "sonnet"
+    agent.write_text("---\nmodel: opus-next\n---\n", encoding="utf-8")
+    assert ind.agent_model("probe", tmp_path) == "opus-next"
+
+
+def test_agent_model_takes_the_first_model_line(tmp_path):
+    (tmp_path / "probe.md").write_text(
+        "---\nname: probe\nmodel: sonnet  \n---\nbody\nmodel: opus\n", encoding="utf-8"
+    )
+    assert ind.agent_model("probe", tmp_path) == "sonnet"
+
+
 def test_classification_of_each_edge():
     got = {e.skill: ind.classify(e) for e in ind.VERIFY_EDGES}
     # The four the plan named + plan itself: same model, bare judgement.
@@ -60,6 +60,15 @@ def test_schema_restatement_on_by_default(monkeypatch):
     assert "SUMMARY:" in text and '"done"' in text
 
 
+def test_schema_restatement_is_rendered_once_per_contract(monkeypatch):
+    monkeypatch.delenv("PENNY_ABLATE_SUMMARY_SCHEMA_RESTATEMENT", raising=False)
+    monkeypatch.delenv("PI_MODEL_TIER", raising=False)
+    first = BasePlaybook._summary_contract_directive(SPEC)
+    assert BasePlaybook._summary_contract_directive(SPEC) is first
+    twin = PrimitiveSpec("Y", "vera", {"required": {"ok": bool}}, "do y")
+    assert '"ok": <true|false>' in BasePlaybook._summary_contract_directive(twin)
+
+
 def test_schema_restatement_ablated(monkeypatch):
     monkeypatch.setenv("PENNY_ABLATE_SUMMARY_SCHEMA_RESTATEMENT", "1")
     assert BasePlaybook._summary_contract_directive(SPEC) == ""
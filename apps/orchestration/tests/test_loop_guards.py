@@ -200,6 +200,24 @@ def test_strategy_repeated_helper(cp):
     assert pb.strategy_repeated(ctx, "use a cache") is False
 
 
+def test_norm_text_normalizes_non_strings_and_memoizes():
+    assert BasePlaybook._norm_text("  Add   INDEX ") == "add index"
+    assert BasePlaybook._norm_text(42) == "42"
+    assert BasePlaybook._norm_text(None) == "none"
+    assert BasePlaybook._norm_text("  Add   INDEX ") is BasePlaybook._norm_text("  Add   INDEX ")
+
+
+def test_iteration_history_is_bounded(cp):
+    pb = LoopPlaybook(cp)
+    ctx = _ctx()
+    for i in range(pb.ITERATION_HISTORY_CAP + 5):
+        ctx.iteration = i
+        pb.record_iteration(ctx, strategy_change=f"s{i}", gaps=["g"])
+    assert len(ctx.iteration_history) == pb.ITERATION_HISTORY_CAP
+    assert ctx.iteration_history[0]["iteration"] == 5  # oldest dropped first
+    assert ctx.iteration_history[-1]["strategy_change"] == f"s{pb.ITERATION_HISTORY_CAP + 4}"
+
+
 def test_is_stalled_helper(cp):
     pb = LoopPlaybook(cp)
     ctx = _ctx()
@@ -216,6 +234,13 @@ def test_is_stalled_helper(cp):
 # ---------------------------------------------------------------------------
 
 
+def test_detect_loader_is_memoized():
+    from orchestration.engine import _load_detect
+
+    assert _load_detect() is _load_detect()
+    assert _load_detect.cache_info().currsize == 1
+
+
 def _mstream(text):
     import json as _j
 
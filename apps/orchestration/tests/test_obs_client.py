@@ -130,6 +130,18 @@ def test_run_start_posts_run_and_event(stub_server):
     assert run_body["status"] == "running"
 
 
+def test_run_row_and_event_share_one_timestamp(stub_server):
+    base_url, collector = stub_server
+    client = ObsClient(base_url=base_url, api_key="")
+    ctx = _ctx()
+    client.run_start(ctx)
+    client.run_end(ctx, "complete", True, 1)
+    runs = [b for p, b in collector.posts if p == "/orchestration/runs"]
+    events = [b["events"][0] for p, b in collector.posts if p == "/orchestration/events"]
+    assert events[0]["timestamp"] == runs[0]["started_at"]
+    assert events[1]["timestamp"] == runs[1]["ended_at"]
+
+
 def test_seq_is_monotonic_across_events(stub_server):
     base_url, collector = stub_server
     client = ObsClient(base_url=base_url, api_key="")
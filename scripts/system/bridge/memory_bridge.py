@@ -17,8 +17,10 @@ Configuration:
 
 import sys
 import os
+import functools
 import json
 import hashlib
+import heapq
 from datetime import datetime
 from pathlib import Path
 
@@ -99,11 +101,22 @@ def _fix_blob_seq_ids(palace_path: str):
         pass
 
 
+@functools.lru_cache(maxsize=None)
+def _palace_client(palace_path: str):
+    """One repaired PersistentClient per palace path per process.
+
+    In-process consumers (evals paging list_drawers, the watchers, the archiver)
+    call several tools per run; the BLOB seq_id repair scans the embeddings table,
+    so it and the client setup run once rather than on every tool call. A failure
+    raises and is therefore not cached."""
+    _fix_blob_seq_ids(palace_path)
+    return chromadb.PersistentClient(path=palace_path)
+
+
 def _get_collection(create: bool = False):
     """Get ChromaDB collection."""
     try:
-        _fix_blob_seq_ids(_config.palace_path)
-        client = chromadb.PersistentClient(path=_config.palace_path)
+        client = _palace_client(str(_config.palace_path))
         # Always use 'mempalace_drawers' to match searcher.py
         collection_name = "mempalace_drawers"
         if create:
@@ -1029,8 +1042,8 @@ def tool_diary_read(params: dict) -> dict:
                 }
             )
 
-        entries.sort(key=lambda x: x["timestamp"], reverse=True)
-        entries = entries[:last_n]
+        # Newest last_n only: a bounded heap instead of sorting the whole diary.
+        entries = heapq.nlargest(last_n, entries, key=lambda x: x["timestamp"])
 
         return {
             "success": True,
@@ -18,53 +18,56 @@ AGENTS_ROOT = DOCS_ROOT / "agents"
 HUMANS_ROOT = DOCS_ROOT / "humans"
 
 
+LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
+LocalLink = tuple[Path, str, str]  # (AGENTS.md, label, target with any #anchor stripped)
+
+
 def collect_links(text: str) -> list[tuple[str, str]]:
-    return re.findall(r"\[([^\]]+)\]\(([^)]+)\)", text)
+    return LINK_RE.findall(text)
 
 
-def check_direct_children_only() -> list[str]:
-    errors: list[str] = []
+def collect_local_links() -> list[LocalLink]:
+    """Every local link in every AGENTS.md, read and parsed once for all link checks.
+
+    An anchor into a file is checked as that file, so targets carry no #anchor."""
+    links: list[LocalLink] = []
     for agents_md in sorted(AGENTS_ROOT.rglob("AGENTS.md")):
-        parent = agents_md.parent.resolve()
-        text = agents_md.read_text()
-        for label, target in collect_links(text):
+        for label, target in collect_links(agents_md.read_text()):
             if target.startswith(("http://", "https://", "#")):
                 continue
-            target = target.split("#", 1)[0]  # an anchor into a direct child is valid
-            if not target:
-                continue
-            resolved = (parent / target).resolve()
-            try:
-                rel = resolved.relative_to(parent)
-            except ValueError:
-                errors.append(f"{agents_md} -> [{label}]({target}) resolves outside its directory")
-                continue
-            parts = rel.parts
-            ok = len(parts) == 1 and parts[0].endswith(".md")
-            ok = ok or (len(parts) == 2 and parts[1] == "AGENTS.md")
-            if not ok:
-                errors.append(
-                    f"{agents_md} -> [{label}]({target}) resolves to {rel} (not a direct child)"
-                )
+            target = target.split("#", 1)[0]
+            if target:
+                links.append((agents_md, label, target))
+    return links
+
+
+def check_direct_children_only(links: list[LocalLink] | None = None) -> list[str]:
+    errors: list[str] = []
+    for agents_md, label, target in collect_local_links() if links is None else links:
+        parent = agents_md.parent.resolve()
+        resolved = (parent / target).resolve()
+        try:
+            rel = resolved.relative_to(parent)
+        except ValueError:
+            errors.append(f"{agents_md} -> [{label}]({target}) resolves outside its directory")
+            continue
+        parts = rel.parts
+        ok = len(parts) == 1 and parts[0].endswith(".md")
+        ok = ok or (len(parts) == 2 and parts[1] == "AGENTS.md")
+        if not ok:
+            errors.append(
+                f"{agents_md} -> [{label}]({target}) resolves to {rel} (not a direct child)"
+            )
     return errors
 
 
-def check_referenced_files_exist() -> list[str]:
+def check_referenced_files_exist(links: list[LocalLink] | None = None) -> list[str]:
     errors: list[str] = []
-    for agents_md in sorted(AGENTS_ROOT.rglob("AGENTS.md")):
-        parent = agents_md.parent
-        text = agents_md.read_text()
-        for label, target in collect_links(text):
-            if target.startswith(("http://", "https://", "#")):
-                continue
-            target = target.split("#", 1)[0]  # anchors are checked as their file
-            if not target:
-                continue
-            resolved = (parent / target).resolve()
-            if not resolved.exists():
-                errors.append(
-                    f"{agents_md} -> [{label}]({target}) points to missing file {resolved}"
-                )
+    for agents_md, label, target in collect_local_links() if links is None else links:
+        resolved = (agents_md.parent / target).resolve()
+        if not resolved.exists():
+            errors.append(f"{agents_md} -> [{label}]({target}) points to missing file {resolved}")
     return errors
 
 
@@ -92,14 +95,15 @@ def check_humans_agents_files() -> list[Path]:
 def main() -> int:
     ok = True
 
-    child_errors = check_direct_children_only()
+    links = collect_local_links()
+    child_errors = check_direct_children_only(links)
     if child_errors:
         ok = False
         print(f"FAIL: {len(child_errors)} AGENTS.md link(s) violate direct-children rule")
         for err in child_errors:
             print(f"  {err}")
 
-    missing_files = check_referenced_files_exist()
+    missing_files = check_referenced_files_exist(links)
     if missing_files:
         ok = False
         print(f"FAIL: {len(missing_files)} AGENTS.md link(s) point to missing files")
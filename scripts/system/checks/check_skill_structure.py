@@ -12,10 +12,12 @@ Usage:
 
 import argparse
 import json
+import os
 import re
+import stat
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Set, Tuple
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 SKILLS_DIR = PROJECT_ROOT / ".pi" / "skills"
@@ -38,6 +40,59 @@ REQUIRED_FILES = [
 # mandated filename — skills name them freely.
 FLOW_DIAGRAM_ANY = ["resources/flow.html", "resources/flow.mmd"]
 
+# SKILL.md patterns, compiled once at import instead of on every skill checked.
+NAME_FIELD_RE = re.compile(r"^name:\s*(\S+)", re.MULTILINE)
+NAME_FORMAT_RE = re.compile(r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?$")
+DESCRIPTION_FIELD_RE = re.compile(r"^description:\s*(.+)", re.MULTILINE)
+STATE_MACHINE_RE = re.compile(r"^\s*state_machine:\s*true", re.MULTILINE)
+
+# Required SKILL.md sections (case-insensitive header match), each mapped to its
+# named group in REQUIRED_SECTIONS_RE — one alternation, so a single sweep of the
+# file finds every required header instead of one search per section.
+# Note: no "Storing Learnings" section — the engine records run outcomes
+# automatically against run_id; skills no longer write learnings by hand.
+REQUIRED_SECTIONS = {
+    "When to Use": "when_to_use",
+    "When Not to Use": "when_not_to_use",
+    "Invocation": "invocation",
+}
+REQUIRED_SECTIONS_RE = re.compile(
+    r"^##\s+(?:"
+    r"(?P<when_to_use>When to Use\s*$)"
+    r"|(?P<when_not_to_use>When\s+(?i:Not|NOT)\s+to\s+Use\s*$)"
+    r"|(?P<invocation>Invocation)"
+    r")",
+    re.MULTILINE,
+)
+
+# The one spelling every in-tree skill uses for each required section. Found as a
+# literal line it settles the check outright; the flexible pattern above only runs
+# for a skill that spells a header differently (or is missing one).
+CANONICAL_SECTION_HEADERS = {
+    "When to Use": "\n## When to Use\n",
+    "When Not to Use": "\n## When Not to Use\n",
+    "Invocation": "\n## Invocation",
+}
+
+# Anti-case clause: accept any natural phrasing of "do not use …" ("do not use
+# when/for/to/on/if …", "don't use …"), not just the exact trigram — the clause's
+# presence is what matters, not its wording.
+ANTI_CASE_MARKERS = ("do not use", "don't use", "do not apply", "avoid using")
+
+# Report icon per issue severity.
+SEVERITY_ICONS = {"ERROR": "❌", "WARN": "⚠️", "INFO": "ℹ️"}
+
+# Prohibited content in SKILL.md (belongs in assets/prompts/). Only flagged when it
+# appears in a table row, not as a passing mention. Each entry keeps its literal so
+# the table regex only runs on files that mention it at all.
+PROHIBITED_TABLE_CONTENT = [
+    (literal, re.compile(r"\|[^\n]*" + re.escape(literal)), msg)
+    for literal, msg in (
+        (r"CREST", "CREST domain table — belongs in assets/prompts/*.md"),
+        (r"Domain Guidance", "Domain Guidance references — belongs in assets/prompts/*.md"),
+    )
+]
+
 
 def discover_skills() -> List[Path]:
     """Find all skill directories under .pi/skills/."""
@@ -45,14 +100,35 @@ def discover_skills() -> List[Path]:
         print(f"ERROR: Skills directory not found: {SKILLS_DIR}")
         sys.exit(1)
 
-    skills = []
-    for entry in SKILLS_DIR.iterdir():
-        if entry.is_dir() and not entry.name.startswith(".") and not entry.name.startswith("_"):
-            skills.append(entry)
+    with os.scandir(SKILLS_DIR) as entries:
+        skills = [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_dir() and not entry.name.startswith((".", "_"))
+        ]
 
     return sorted(skills)
 
 
+def _names_matching(directory: Path, prefix: str, suffix: str) -> List[str]:
+    """Names of entries in ``directory`` matching ``prefix*suffix`` — one scandir, no glob
+    pattern compile or per-entry Path objects."""
+    with os.scandir(directory) as entries:
+        return [e.name for e in entries if e.name.startswith(prefix) and e.name.endswith(suffix)]
+
+
+def _entry_kind(path: Path) -> Optional[str]:
+    """``"dir"``, ``"file"``, ``"other"``, or None when missing — one stat() where
+    ``exists()`` followed by ``is_dir()``/``is_file()`` costs two."""
+    try:
+        mode = path.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    if stat.S_ISDIR(mode):
+        return "dir"
+    return "file" if stat.S_ISREG(mode) else "other"
+
+
 def check_skill(skill_dir: Path) -> List[Tuple[str, str]]:  # noqa: C901
     """Return list of (severity, message) issues for a skill."""
     issues = []
@@ -68,24 +144,28 @@ def check_skill(skill_dir: Path) -> List[Tuple[str, str]]:  # noqa: C901
     is_delegate = "delegates_to:" in content
 
     if not is_delegate:
+        # Stat every checked path once up front; the checks below share the results.
+        kinds = {
+            rel: _entry_kind(skill_dir / rel)
+            for rel in (*REQUIRED_DIRS, *REQUIRED_FILES, *FLOW_DIAGRAM_ANY, "tests")
+        }
+
         # Check required directories (only for full skills, not delegates)
         for rel_dir in REQUIRED_DIRS:
-            full_path = skill_dir / rel_dir
-            if not full_path.exists():
+            if kinds[rel_dir] is None:
                 issues.append(("ERROR", f"Missing directory: {rel_dir}"))
-            elif not full_path.is_dir():
+            elif kinds[rel_dir] != "dir":
                 issues.append(("ERROR", f"Not a directory: {rel_dir}"))
 
         # Check required files (only for full skills, not delegates)
         for rel_file in REQUIRED_FILES:
-            full_path = skill_dir / rel_file
-            if not full_path.exists():
+            if kinds[rel_file] is None:
                 issues.append(("ERROR", f"Missing file: {rel_file}"))
-            elif not full_path.is_file():
+            elif kinds[rel_file] != "file":
                 issues.append(("ERROR", f"Not a file: {rel_file}"))
 
         # Flow diagram: require at least one of flow.html / flow.mmd (either format).
-        if not any((skill_dir / rel).is_file() for rel in FLOW_DIAGRAM_ANY):
+        if not any(kinds[rel] == "file" for rel in FLOW_DIAGRAM_ANY):
             issues.append(
                 (
                     "ERROR",
@@ -95,144 +175,128 @@ def check_skill(skill_dir: Path) -> List[Tuple[str, str]]:  # noqa: C901
             )
 
         # Check for test files in tests/
-        tests_dir = skill_dir / "tests"
-        if tests_dir.exists() and tests_dir.is_dir():
-            test_files = list(tests_dir.glob("test_*.py"))
-            if not test_files:
+        if kinds["tests"] == "dir":
+            if not _names_matching(skill_dir / "tests", "test_", ".py"):
                 issues.append(("WARN", "No test_*.py files in tests/"))
-        elif tests_dir.exists():
+        elif kinds["tests"] is not None:
             issues.append(("ERROR", "tests/ exists but is not a directory"))
 
         # Check that test files are NOT in scripts/
-        scripts_dir = skill_dir / "scripts"
-        if scripts_dir.exists() and scripts_dir.is_dir():
-            misplaced_tests = list(scripts_dir.glob("test_*.py"))
+        if kinds["scripts"] == "dir":
+            misplaced_tests = _names_matching(skill_dir / "scripts", "test_", ".py")
             if misplaced_tests:
                 issues.append(
                     (
                         "ERROR",
-                        f"Test files found in scripts/: {[f.name for f in misplaced_tests]} — move to tests/",
+                        f"Test files found in scripts/: {misplaced_tests} — move to tests/",
                     )
                 )
 
         # Check for prompt files in assets/prompts/
-        prompts_dir = skill_dir / "assets" / "prompts"
-        if prompts_dir.exists() and prompts_dir.is_dir():
-            prompt_files = list(prompts_dir.glob("*.md"))
-            if not prompt_files:
+        if kinds["assets/prompts"] == "dir":
+            if not _names_matching(skill_dir / "assets" / "prompts", "", ".md"):
                 issues.append(("WARN", "No prompt files in assets/prompts/"))
-        elif prompts_dir.exists():
+        elif kinds["assets/prompts"] is not None:
             issues.append(("ERROR", "assets/prompts/ exists but is not a directory"))
 
-    # Check SKILL.md YAML frontmatter has required fields
-    skill_md = skill_dir / "SKILL.md"
-    if skill_md.exists():
-        content = skill_md.read_text(encoding="utf-8")
-        if not content.startswith("---"):
-            issues.append(("ERROR", "SKILL.md missing YAML frontmatter"))
-        else:
-            for field in ("name:", "description:"):
-                if field not in content:
-                    issues.append(("ERROR", f"SKILL.md frontmatter missing '{field}'"))
-
-            # Validate name format: lowercase a-z, 0-9, hyphens only
-            name_match = re.search(r"^name:\s*(\S+)", content, re.MULTILINE)
-            if name_match:
-                declared_name = name_match.group(1)
-                if not re.match(r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?$", declared_name):
-                    issues.append(
-                        (
-                            "ERROR",
-                            f"SKILL.md name '{declared_name}' contains invalid characters (must be lowercase a-z, 0-9, hyphens only)",
-                        )
+    # Check SKILL.md YAML frontmatter has required fields (content was read above)
+    if not content.startswith("---"):
+        issues.append(("ERROR", "SKILL.md missing YAML frontmatter"))
+    else:
+        for field in ("name:", "description:"):
+            if field not in content:
+                issues.append(("ERROR", f"SKILL.md frontmatter missing '{field}'"))
+
+        # Validate name format: lowercase a-z, 0-9, hyphens only
+        name_match = NAME_FIELD_RE.search(content)
+        if name_match:
+            declared_name = name_match.group(1)
+            if not NAME_FORMAT_RE.match(declared_name):
+                issues.append(
+                    (
+                        "ERROR",
+                        f"SKILL.md name '{declared_name}' contains invalid characters (must be lowercase a-z, 0-9, hyphens only)",
                     )
-                elif declared_name != name:
-                    issues.append(
-                        (
-                            "ERROR",
-                            f"SKILL.md name '{declared_name}' does not match directory name '{name}'",
-                        )
+                )
+            elif declared_name != name:
+                issues.append(
+                    (
+                        "ERROR",
+                        f"SKILL.md name '{declared_name}' does not match directory name '{name}'",
                     )
-            else:
-                issues.append(("ERROR", "SKILL.md: could not parse name field"))
+                )
+        else:
+            issues.append(("ERROR", "SKILL.md: could not parse name field"))
 
-            # Engine model: a full (non-delegate) skill must route through the shared
-            # orchestration engine. The legacy `state_machine: true` marker is removed.
-            if not is_delegate:
-                if "engine: orchestration" not in content:
-                    issues.append(
-                        (
-                            "ERROR",
-                            "SKILL.md frontmatter missing 'metadata.penny.engine: orchestration' "
-                            "(the routing key for engine-backed skills)",
-                        )
+        # Engine model: a full (non-delegate) skill must route through the shared
+        # orchestration engine. The legacy `state_machine: true` marker is removed.
+        if not is_delegate:
+            if "engine: orchestration" not in content:
+                issues.append(
+                    (
+                        "ERROR",
+                        "SKILL.md frontmatter missing 'metadata.penny.engine: orchestration' "
+                        "(the routing key for engine-backed skills)",
                     )
-                if re.search(r"^\s*state_machine:\s*true", content, re.MULTILINE):
-                    issues.append(
-                        (
-                            "ERROR",
-                            "SKILL.md frontmatter has legacy 'state_machine: true' — removed; use "
-                            "'engine: orchestration'",
-                        )
+                )
+            if "state_machine" in content and STATE_MACHINE_RE.search(content):
+                issues.append(
+                    (
+                        "ERROR",
+                        "SKILL.md frontmatter has legacy 'state_machine: true' — removed; use "
+                        "'engine: orchestration'",
                     )
+                )
 
-            # Validate description follows canonical trigger pattern:
-            # "[sentence]. Use when [trigger conditions + signal phrases]. Do not use when [anti-cases]."
-            desc_match = re.search(r"^description:\s*(.+)", content, re.MULTILINE)
-            if desc_match:
-                desc = desc_match.group(1).strip().strip('"')
-                if "use when" not in desc.lower():
-                    issues.append(
-                        (
-                            "ERROR",
-                            "SKILL.md description missing 'Use when' — must follow: '[sentence]. Use when [trigger conditions + signal phrases]. Do not use when [anti-cases].'",
-                        )
+        # Validate description follows canonical trigger pattern:
+        # "[sentence]. Use when [trigger conditions + signal phrases]. Do not use when [anti-cases]."
+        desc_match = DESCRIPTION_FIELD_RE.search(content)
+        if desc_match:
+            desc_lower = desc_match.group(1).strip().strip('"').lower()
+            if "use when" not in desc_lower:
+                issues.append(
+                    (
+                        "ERROR",
+                        "SKILL.md description missing 'Use when' — must follow: '[sentence]. Use when [trigger conditions + signal phrases]. Do not use when [anti-cases].'",
                     )
-                # Anti-case clause: accept any natural phrasing of "do not use …"
-                # ("do not use when/for/to/on/if …", "don't use …"), not just the
-                # exact trigram — the clause's presence is what matters, not its wording.
-                anti_case_markers = ("do not use", "don't use", "do not apply", "avoid using")
-                if not any(marker in desc.lower() for marker in anti_case_markers):
-                    issues.append(
-                        (
-                            "ERROR",
-                            "SKILL.md description missing an anti-case clause — include 'Do not use …' "
-                            "(e.g. 'Do not use when/for/to …') describing when NOT to use this skill.",
-                        )
+                )
+            # Anti-case clause (any phrasing in ANTI_CASE_MARKERS).
+            if not any(marker in desc_lower for marker in ANTI_CASE_MARKERS):
+                issues.append(
+                    (
+                        "ERROR",
+                        "SKILL.md description missing an anti-case clause — include 'Do not use …' "
+                        "(e.g. 'Do not use when/for/to …') describing when NOT to use this skill.",
                     )
+                )
 
-        # ── Content section validation ──
-        # Check required sections exist (case-insensitive header match)
-        # Note: no "Storing Learnings" section — the engine records run outcomes
-        # automatically against run_id; skills no longer write learnings by hand.
-        required_sections = {
-            "When to Use": r"^##\s+When to Use\s*$",
-            "When Not to Use": r"^##\s+When\s+(?i:Not|NOT)\s+to\s+Use\s*$",
-            "Invocation": r"^##\s+Invocation",
-        }
-
-        for section_name, pattern in required_sections.items():
-            if not re.search(pattern, content, re.MULTILINE):
-                issues.append(("ERROR", f"SKILL.md missing required section: '{section_name}'"))
+    # ── Content section validation ──
+    found_sections: Optional[Set[str]] = None
+    for section_name, group in REQUIRED_SECTIONS.items():
+        if CANONICAL_SECTION_HEADERS[section_name] in content:
+            continue
+        if found_sections is None:
+            found_sections = {m.lastgroup for m in REQUIRED_SECTIONS_RE.finditer(content)}
+        if group not in found_sections:
+            issues.append(("ERROR", f"SKILL.md missing required section: '{section_name}'"))
 
-        # Check for prohibited content in SKILL.md (belongs in assets/prompts/)
-        prohibited = [
-            (r"CREST", "CREST domain table — belongs in assets/prompts/*.md"),
-            (r"Domain Guidance", "Domain Guidance references — belongs in assets/prompts/*.md"),
-        ]
-        for pattern, msg in prohibited:
-            # Only flag if it appears in a table or structured form (not just a passing mention)
-            if re.search(r"\|[^\n]*" + pattern, content):
-                issues.append(("WARN", f"SKILL.md may contain {msg}"))
+    # Check for prohibited content in SKILL.md (belongs in assets/prompts/)
+    for literal, pattern, msg in PROHIBITED_TABLE_CONTENT:
+        if literal in content and pattern.search(content):
+            issues.append(("WARN", f"SKILL.md may contain {msg}"))
 
     return issues
 
 
-def check_skill_room_registration() -> List[Tuple[str, str]]:
+def check_skill_room_registration(
+    skill_dirs: Optional[List[Path]] = None,
+) -> List[Tuple[str, str]]:
     """Every live skill must be registered in tiered_memory/skill_rooms.json so its
     MemPalace scratch decays. A DEDICATED-wing skill missing here silently
     re-creates the wing_jsa accretion (2,086-drawer / 77% bloat this guard exists
-    to prevent); a penny-wing skill missing here is a hygiene gap."""
+    to prevent); a penny-wing skill missing here is a hygiene gap.
+
+    ``skill_dirs`` reuses a ``discover_skills()`` listing; omitted, it is scanned."""
     issues: List[Tuple[str, str]] = []
     manifest_path = (
         PROJECT_ROOT / "scripts" / "system" / "tiered_memory" / "skill_rooms.json"
@@ -242,13 +306,9 @@ def check_skill_room_registration() -> List[Tuple[str, str]]:
     except (OSError, json.JSONDecodeError) as exc:
         return [("ERROR", f"skill_rooms.json unreadable ({exc}) — scratch retention is unverified")]
     registered = manifest.get("skills", {})
-    live = [
-        d.name
-        for d in SKILLS_DIR.iterdir()
-        if d.is_dir()
-        and not d.name.startswith((".", "_"))
-        and (d / "SKILL.md").exists()
-    ]
+    if skill_dirs is None:
+        skill_dirs = discover_skills()
+    live = [d.name for d in skill_dirs if (d / "SKILL.md").exists()]
     for name in sorted(live):
         cfg = registered.get(name)
         if cfg is None:
@@ -284,7 +344,8 @@ def main():
     parser.add_argument("--skill", help="Validate only a specific skill name")
     args = parser.parse_args()
 
-    skills = discover_skills()
+    all_skills = discover_skills()
+    skills = all_skills
     if not skills:
         print("No skills found.")
         sys.exit(0)
@@ -309,8 +370,7 @@ def main():
 
         print(f"  ⚠️  {name}")
         for severity, msg in issues:
-            icon_map = {"ERROR": "❌", "WARN": "⚠️", "INFO": "ℹ️"}
-            icon = icon_map.get(severity, "•")
+            icon = SEVERITY_ICONS.get(severity, "•")
             print(f"     {icon} {msg}")
             if severity == "ERROR":
                 total_errors += 1
@@ -318,12 +378,11 @@ def main():
                 total_warnings += 1
 
     # Global check: MemPalace scratch retention is registered for every skill.
-    room_issues = check_skill_room_registration()
+    room_issues = check_skill_room_registration(all_skills)
     if room_issues:
         print("  🗄️  MemPalace room registration (tiered_memory/skill_rooms.json)")
         for severity, msg in room_issues:
-            icon_map = {"ERROR": "❌", "WARN": "⚠️", "INFO": "ℹ️"}
-            print(f"     {icon_map.get(severity, '•')} {msg}")
+            print(f"     {SEVERITY_ICONS.get(severity, '•')} {msg}")
             if severity == "ERROR":
                 total_errors += 1
             elif severity == "WARN":
@@ -4,8 +4,13 @@ Pulls from penny/outcomes, penny/diary, penny/signals, penny/system_amendments.
 Produces digest JSON including session_ids for observability correlation.
 """
 
+import re
 from typing import List, Dict, Any, Optional
 
+# Text fallback for a diary entry's session id: an id-shaped token (hex/uuid, 8+
+# chars) after an explicit "session_id:" marker. Compiled once, not per drawer.
+_SESSION_ID_RE = re.compile(r"session[_-]?id[:=]\s*([0-9a-fA-F][0-9a-fA-F-]{7,})", re.IGNORECASE)
+
 
 def aggregate_outcomes(
     outcomes: List[Dict[str, Any]], include_domains: bool = False
@@ -154,11 +159,7 @@ def build_digest_json(
             session_ids.add(sid)
             continue
         content = d.get("text", "") or d.get("content", "")
-        import re
-
-        for match in re.finditer(
-            r"session[_-]?id[:=]\s*([0-9a-fA-F][0-9a-fA-F-]{7,})", content, re.IGNORECASE
-        ):
+        for match in _SESSION_ID_RE.finditer(content):
             session_ids.add(match.group(1))
 
     attention = identify_attention_flags(outcomes, signals=signals or [])
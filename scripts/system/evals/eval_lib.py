@@ -23,6 +23,7 @@ Design notes:
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
@@ -204,17 +205,30 @@ def list_drawers_all(
         offset += page
 
 
+@functools.lru_cache(maxsize=None)
+def _room_snapshot(
+    room: str, wings: Tuple[str, ...], include_content: bool
+) -> Tuple[Dict[str, Any], ...]:
+    """One bridge listing per (room, wings, include_content) per process — several
+    checks across sections read the same room (system_amendments three times).
+    Checks are read-only, so the snapshot is stable for the run; a bridge failure
+    raises and is therefore not cached."""
+    seen: Dict[str, Dict[str, Any]] = {}
+    for wing in wings:
+        for drawer in list_drawers_all(wing=wing, room=room, include_content=include_content):
+            seen[drawer["id"]] = drawer
+    return tuple(seen.values())
+
+
 def load_room(
     room: str,
     wings: Tuple[str, ...] = ("penny", "wing_penny"),
     include_content: bool = False,
 ) -> List[Dict[str, Any]]:
-    """Load a room across the historic penny/wing_penny namespace split."""
-    seen: Dict[str, Dict[str, Any]] = {}
-    for wing in wings:
-        for drawer in list_drawers_all(wing=wing, room=room, include_content=include_content):
-            seen[drawer["id"]] = drawer
-    return list(seen.values())
+    """Load a room across the historic penny/wing_penny namespace split.
+
+    Drawers are shallow copies of the per-process snapshot."""
+    return [dict(d) for d in _room_snapshot(room, tuple(wings), include_content)]
 
 
 def newest_filed_at(drawers: List[Dict[str, Any]]) -> Optional[datetime]:
@@ -253,20 +267,35 @@ def parse_outcome(text: str) -> Dict[str, Any]:
     return record
 
 
-def load_outcomes(window_days: Optional[float] = None) -> List[Dict[str, Any]]:
-    """Load parsed outcome records; each carries ``_when`` (aware UTC or None)."""
-    outcomes: List[Dict[str, Any]] = []
-    cutoff = now_utc() - timedelta(days=window_days) if window_days else None
+@functools.lru_cache(maxsize=1)
+def _parsed_outcomes() -> Tuple[Dict[str, Any], ...]:
+    """Every parsed outcome record, read + parsed ONCE per process.
+
+    A suite run calls ``load_outcomes`` from a dozen checks (often just to count or
+    re-window the same room); the bridge listing and per-drawer parse are paid once.
+    Checks are read-only, so the snapshot is stable for the run. A bridge failure
+    raises and is therefore not cached."""
+    records: List[Dict[str, Any]] = []
     for drawer in load_room("outcomes", include_content=True):
         record = parse_outcome(drawer.get("content") or "")
         if not record:
             continue
-        when = parse_when(record.get("timestamp")) or parse_when(drawer.get("filed_at"))
-        record["_when"] = when
-        if cutoff is not None and (when is None or when < cutoff):
-            continue
-        outcomes.append(record)
-    return outcomes
+        record["_when"] = parse_when(record.get("timestamp")) or parse_when(drawer.get("filed_at"))
+        records.append(record)
+    return tuple(records)
+
+
+def load_outcomes(window_days: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Load parsed outcome records; each carries ``_when`` (aware UTC or None).
+
+    Records are shallow copies of the per-process snapshot, so a caller may annotate
+    them freely."""
+    cutoff = now_utc() - timedelta(days=window_days) if window_days else None
+    return [
+        dict(record)
+        for record in _parsed_outcomes()
+        if cutoff is None or (record["_when"] is not None and record["_when"] >= cutoff)
+    ]
 
 
 def normalize_reason(record: Dict[str, Any]) -> str:
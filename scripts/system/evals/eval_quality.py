@@ -13,7 +13,7 @@ records is noise, and ratcheting noise trains the baseline on luck.
 from __future__ import annotations
 
 import json
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Tuple
 
 from eval_lib import (
@@ -82,26 +82,26 @@ def check_repeat_mismatch_rate() -> EvalResult:
     if len(mismatches) < MIN_MISMATCHES:
         raise EvalSkip(f"only {len(mismatches)} MISMATCH outcomes in 90d (need {MIN_MISMATCHES})")
 
-    suboptimal = [o for o in outcomes if o.get("outcome") in SUBOPTIMAL]
-    repeats = 0
-    scored = 0
-    for record in mismatches:
-        signature = normalize_reason(record)
-        if not signature:
+    # One pass over the suboptimal outcomes: the EARLIEST occurrence of each
+    # (domain, failure signature). A MISMATCH repeats iff that earliest instance is
+    # ≥3 days older — same answer as scanning every earlier record per MISMATCH,
+    # without the pairwise loop. Each record's key is built once and the MISMATCH
+    # keys are kept for the lookup, so no reason is normalized twice.
+    first_seen: Dict[Tuple[str, str], datetime] = {}
+    scored_keys: List[Tuple[Tuple[str, str], datetime]] = []
+    for o in outcomes:
+        if o.get("outcome") not in SUBOPTIMAL:
             continue
-        scored += 1
-        for earlier in suboptimal:
-            if earlier is record:
-                continue
-            gap = (record["_when"] - earlier["_when"]).total_seconds() / 86400.0
-            if gap < 3:
-                continue
-            if (
-                str(earlier.get("domain") or "") == str(record.get("domain") or "")
-                and normalize_reason(earlier) == signature
-            ):
-                repeats += 1
-                break
+        sig = normalize_reason(o)
+        if not sig:
+            continue
+        key = (str(o.get("domain") or ""), sig)
+        if key not in first_seen or o["_when"] < first_seen[key]:
+            first_seen[key] = o["_when"]
+        if o["outcome"] == "MISMATCH":
+            scored_keys.append((key, o["_when"]))
+    scored = len(scored_keys)
+    repeats = sum(1 for key, when in scored_keys if when - first_seen[key] >= timedelta(days=3))
     if scored == 0:
         raise EvalSkip("no MISMATCH carries a usable failure signature (reason field empty)")
     rate = repeats / scored
@@ -144,28 +144,26 @@ def check_calibration_gap() -> EvalResult:
     If CERTAIN/PROBABLE actions succeed no more often than POSSIBLE/UNCERTAIN
     ones, the confidence vocabulary is decoration, not information.
     """
-    outcomes = [
-        o
-        for o in load_outcomes(window_days=90)
-        if o.get("outcome") in ("MATCH", "PARTIAL", "MISMATCH")
-    ]
-    high = [
-        o
-        for o in outcomes
-        if str(o.get("confidence_at_action") or "").strip().upper() in HIGH_CONFIDENCE
-    ]
-    low = [
-        o
-        for o in outcomes
-        if str(o.get("confidence_at_action") or "").strip().upper() in LOW_CONFIDENCE
-    ]
-    if len(high) < MIN_SAMPLE or len(low) < MIN_SAMPLE:
+    # One pass: normalize each record's confidence once and tally (n, MATCH) for
+    # its bucket, rather than two bucket filters plus two MATCH recounts.
+    n_high = n_low = match_high = match_low = 0
+    for o in load_outcomes(window_days=90):
+        outcome = o.get("outcome")
+        if outcome not in ("MATCH", "PARTIAL", "MISMATCH"):
+            continue
+        confidence = str(o.get("confidence_at_action") or "").strip().upper()
+        if confidence in HIGH_CONFIDENCE:
+            n_high += 1
+            match_high += outcome == "MATCH"
+        elif confidence in LOW_CONFIDENCE:
+            n_low += 1
+            match_low += outcome == "MATCH"
+    if n_high < MIN_SAMPLE or n_low < MIN_SAMPLE:
         raise EvalSkip(
-            f"need {MIN_SAMPLE}+ outcomes per confidence bucket (high={len(high)}, "
-            f"low={len(low)})"
+            f"need {MIN_SAMPLE}+ outcomes per confidence bucket (high={n_high}, low={n_low})"
         )
-    p_high = sum(1 for o in high if o["outcome"] == "MATCH") / len(high)
-    p_low = sum(1 for o in low if o["outcome"] == "MATCH") / len(low)
+    p_high = match_high / n_high
+    p_low = match_low / n_low
     gap = p_high - p_low
     return EvalResult(
         name="quality.calibration_gap_90d",
@@ -173,8 +171,7 @@ def check_calibration_gap() -> EvalResult:
         value=round(gap, 4),
         direction=UP_GOOD,
         unit="fraction",
-        detail=f"P(MATCH|high)={p_high:.2f} (n={len(high)}), "
-        f"P(MATCH|low)={p_low:.2f} (n={len(low)})",
+        detail=f"P(MATCH|high)={p_high:.2f} (n={n_high}), P(MATCH|low)={p_low:.2f} (n={n_low})",
     )
 
 
@@ -210,11 +207,13 @@ def check_amendment_efficacy() -> EvalResult:
     applied = _applied_amendments()
     if not applied:
         raise EvalSkip("no APPLIED amendments yet — the loop has not closed once")
-    outcomes = [
-        o
-        for o in load_outcomes()
-        if o.get("outcome") in ("MATCH", "PARTIAL", "MISMATCH") and o.get("_when")
-    ]
+    # Partition the rated outcomes by domain once; each amendment then scans only
+    # its own domain's records instead of re-filtering the whole ledger.
+    by_domain: Dict[str, List[Dict[str, Any]]] = {}
+    for o in load_outcomes():
+        if o.get("outcome") in ("MATCH", "PARTIAL", "MISMATCH") and o.get("_when"):
+            by_domain.setdefault(str(o.get("domain") or "").lower(), []).append(o)
+    window = timedelta(days=30)
     deltas = []
     thin = 0
     unattributable = 0
@@ -228,8 +227,7 @@ def check_amendment_efficacy() -> EvalResult:
             # can't reproduce. Skip it rather than fake attribution.
             unattributable += 1
             continue
-        pool = [o for o in outcomes if str(o.get("domain") or "").lower() == domain]
-        window = timedelta(days=30)
+        pool = by_domain.get(domain, [])
         before = [o for o in pool if cut - window <= o["_when"] < cut]
         after = [o for o in pool if cut < o["_when"] <= cut + window]
         if len(before) < MIN_MISMATCHES or len(after) < MIN_MISMATCHES:
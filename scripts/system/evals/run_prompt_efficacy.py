@@ -618,10 +618,11 @@ def print_summary(
         print(f"{family:<10} {r['on']:>9.0%} {r['off']:>10.0%} {r['delta']:>+8.0%} {r['n']:>4}")
     if ablate:
         print("\nablation (vs full frame, first model only):")
-        base = ablation_rates(cells, "on")
-        for arm_name in sorted({c["arm"] for c in cells if c["arm"].startswith("ablate:")}):
-            rate = ablation_rates(cells, arm_name)
-            if base is not None and rate is not None:
+        table = ablation_table(cells)
+        base = table.get("on")
+        for arm_name in sorted(a for a in table if a.startswith("ablate:")):
+            rate = table[arm_name]
+            if base is not None:
                 print(f"  -{arm_name[7:]:<38} {rate:>7.0%}  ({rate - base:+.0%} vs full)")
     errored = [c for c in cells if c["error"]]
     if errored:
@@ -741,17 +742,23 @@ def main() -> int:
     return 0
 
 
+def ablation_table(cells: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Pass rate per arm restricted to the ablation model (the first model).
+
+    One grouping pass over the cells for every arm at once — the summary used to
+    rescan the whole matrix twice per ablation arm. Arms with no scored cell are
+    absent."""
+    ablation_models = {c["model"] for c in cells if c["arm"].startswith("ablate:")}
+    scores: Dict[str, List[Any]] = {}
+    for c in cells:
+        if not c["error"] and c["model"] in ablation_models:
+            scores.setdefault(c["arm"], []).append(c["passed"])
+    return {arm: sum(s) / len(s) for arm, s in scores.items()}
+
+
 def ablation_rates(cells: List[Dict[str, Any]], arm: str) -> Optional[float]:
     """Pass rate for one arm restricted to the ablation model (the first model)."""
-    ablation_models = {c["model"] for c in cells if c["arm"].startswith("ablate:")}
-    scores = [
-        c["passed"]
-        for c in cells
-        if c["arm"] == arm and not c["error"] and c["model"] in ablation_models
-    ]
-    if not scores:
-        return None
-    return sum(scores) / len(scores)
+    return ablation_table(cells).get(arm)
 
 
 if __name__ == "__main__":
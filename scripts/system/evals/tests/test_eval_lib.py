@@ -2,6 +2,7 @@
 
 from datetime import datetime, timezone
 
+import eval_lib
 from eval_lib import (
     DOWN_GOOD,
     ERROR,
@@ -18,6 +19,7 @@ from eval_lib import (
     EvalResult,
     EvalSkip,
     compare,
+    load_outcomes,
     normalize_reason,
     parse_outcome,
     parse_when,
@@ -76,6 +78,56 @@ class TestParseOutcome:
         assert parse_outcome("just some prose with no fields") == {}
 
 
+class TestLoadOutcomes:
+    def test_room_parsed_once_and_windowed_per_call(self, monkeypatch):
+        calls = []
+        now = datetime.now(timezone.utc).isoformat()
+        drawers = [
+            {"id": "a", "content": '{"decision_id": "a", "timestamp": "2020-01-01T00:00:00Z"}'},
+            {"id": "b", "content": '{"decision_id": "b", "timestamp": "%s"}' % now},
+        ]
+
+        def fake_room(room, include_content=False):
+            calls.append(room)
+            return drawers
+
+        monkeypatch.setattr(eval_lib, "load_room", fake_room)
+        eval_lib._parsed_outcomes.cache_clear()
+        try:
+            assert {o["decision_id"] for o in load_outcomes()} == {"a", "b"}
+            assert [o["decision_id"] for o in load_outcomes(window_days=30)] == ["b"]
+            load_outcomes()[0]["decision_id"] = "mutated"
+            assert load_outcomes()[0]["decision_id"] == "a"
+            assert calls == ["outcomes"]
+        finally:
+            eval_lib._parsed_outcomes.cache_clear()
+
+
+class TestLoadRoom:
+    def test_each_room_listed_once_per_process(self, monkeypatch):
+        calls = []
+
+        def fake_list(wing=None, room=None, include_content=False):
+            calls.append((wing, room, include_content))
+            return [{"id": f"{wing}-1", "filed_at": ""}]
+
+        monkeypatch.setattr(eval_lib, "list_drawers_all", fake_list)
+        eval_lib._room_snapshot.cache_clear()
+        try:
+            first = eval_lib.load_room("diary")
+            first[0]["id"] = "mutated"
+            assert [d["id"] for d in eval_lib.load_room("diary")] == ["penny-1", "wing_penny-1"]
+            eval_lib.load_room("diary", include_content=True)
+            assert calls == [
+                ("penny", "diary", False),
+                ("wing_penny", "diary", False),
+                ("penny", "diary", True),
+                ("wing_penny", "diary", True),
+            ]
+        finally:
+            eval_lib._room_snapshot.cache_clear()
+
+
 class TestNormalizeReason:
     def test_prefers_reason(self):
         assert normalize_reason({"reason": "  Timeout  In\nTests "}) == "timeout in tests"
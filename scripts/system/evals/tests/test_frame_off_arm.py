@@ -36,3 +36,19 @@ def test_bare_prompt_constant_is_nonempty():
     # Non-empty (avoids Pi's 0-byte fallback to its default) but whitespace-only.
     assert rpe.BARE_PROMPT != ""
     assert rpe.BARE_PROMPT.strip() == ""
+
+
+def test_ablation_table_groups_every_arm_in_one_pass():
+    def cell(arm, model, passed, error=""):
+        return {"arm": arm, "model": model, "passed": passed, "error": error}
+
+    cells = [
+        cell("on", "m1", True),
+        cell("on", "m1", False),
+        cell("on", "m2", True),  # not the ablation model: excluded
+        cell("ablate:a", "m1", True),
+        cell("ablate:b", "m1", False, error="timeout"),  # errored only: absent
+    ]
+    table = rpe.ablation_table(cells)
+    assert table == {"on": 0.5, "ablate:a": 1.0}
+    assert rpe.ablation_rates(cells, "ablate:b") is None
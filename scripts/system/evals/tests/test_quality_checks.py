@@ -107,3 +107,44 @@ class TestAmendmentEfficacy:
         monkeypatch.setattr(eval_quality, "load_outcomes", lambda *a, **k: outcomes)
         result = eval_quality.check_amendment_efficacy()
         assert result.value == 0.0  # clean both sides; distant mismatches ignored
+
+
+class TestRepeatMismatchRate:
+    def _mismatch(self, days, reason, domain="coding"):
+        return {**_outcome("MISMATCH", days, domain), "reason": reason}
+
+    def test_repeat_needs_same_domain_signature_three_days_apart(self, monkeypatch):
+        outcomes = [
+            self._mismatch(0, "Missed  the edge case"),
+            self._mismatch(4, "missed the edge case"),  # repeat of day 0
+            self._mismatch(5, "wrong file"),
+            self._mismatch(6, "wrong file"),  # only 1 day later — not a repeat
+            self._mismatch(9, "missed the edge case", domain="research"),  # other domain
+        ]
+        monkeypatch.setattr(eval_quality, "load_outcomes", lambda *a, **k: outcomes)
+        result = eval_quality.check_repeat_mismatch_rate()
+        assert result.value == 0.2  # 1 repeat of 5 scored
+
+
+class TestCalibrationGap:
+    def _rated(self, outcome, confidence):
+        return {**_outcome(outcome, 0), "confidence_at_action": confidence}
+
+    def test_gap_from_normalized_confidence_buckets(self, monkeypatch):
+        outcomes = (
+            [self._rated("MATCH", " certain ")] * 4
+            + [self._rated("MISMATCH", "PROBABLE")]
+            + [self._rated("MATCH", "possible")]
+            + [self._rated("PARTIAL", "UNCERTAIN")] * 4
+            + [self._rated("MATCH", "CERTAIN"), {"outcome": "", "confidence_at_action": "CERTAIN"}]
+        )
+        monkeypatch.setattr(eval_quality, "load_outcomes", lambda *a, **k: outcomes)
+        result = eval_quality.check_calibration_gap()
+        assert result.value == round(5 / 6 - 1 / 5, 4)
+        assert "(n=6)" in result.detail and "(n=5)" in result.detail
+
+    def test_skips_thin_bucket(self, monkeypatch):
+        outcomes = [self._rated("MATCH", "CERTAIN")] * 5
+        monkeypatch.setattr(eval_quality, "load_outcomes", lambda *a, **k: outcomes)
+        result = eval_quality.run_checks([("cal", eval_quality.check_calibration_gap)])[0]
+        assert result.status == SKIP
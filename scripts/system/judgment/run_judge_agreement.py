@@ -72,10 +72,13 @@ VERDICT_RE = re.compile(r"verdict\s*[:\-]\s*(pass|fail)", re.IGNORECASE)
 
 def load_corpus() -> List[Dict[str, Any]]:
     records = []
-    for line in CORPUS_PATH.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if line:
-            records.append(json.loads(line))
+    # Iterate the JSONL lazily: no whole-file string plus a list of every line
+    # alongside the parsed records.
+    with CORPUS_PATH.open(encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
     return records
 
 
@@ -83,6 +86,31 @@ def load_rubrics() -> Dict[str, Any]:
     return json.loads(RUBRICS_PATH.read_text(encoding="utf-8")).get("rubrics", {})
 
 
+def _corpus_has_id(path: Path, record_id: str) -> bool:
+    """True if ``path`` already holds a record with ``record_id``. Streams the JSONL
+    line by line and stops at the first hit; a line is only JSON-decoded when the id
+    appears in it, so an append never re-parses the whole corpus. The prefilter looks
+    for the id as a JSON string body — escaped (quotes, backslashes, and non-ASCII as
+    ``ensure_ascii`` writes it) or with raw non-ASCII as ``append_corpus_record``
+    writes it. A missing corpus holds nothing."""
+    escaped = json.dumps(record_id)[1:-1]
+    unescaped = json.dumps(record_id, ensure_ascii=False)[1:-1]
+    try:
+        fh = path.open(encoding="utf-8")
+    except FileNotFoundError:
+        return False
+    with fh:
+        for line in fh:
+            if escaped not in line and unescaped not in line:
+                continue
+            try:
+                if json.loads(line).get("id") == record_id:
+                    return True
+            except (json.JSONDecodeError, AttributeError):
+                continue
+    return False
+
+
 def append_corpus_record(
     artifact: str,
     verdict: str,
@@ -100,9 +128,8 @@ def append_corpus_record(
     """
     if verdict not in ("PASS", "FAIL"):
         raise ValueError(f"verdict must be PASS/FAIL, got {verdict!r}")
-    for existing in load_corpus():
-        if existing.get("id") == record_id:
-            return False  # already recorded
+    if _corpus_has_id(path, record_id):
+        return False  # already recorded
     record = {
         "id": record_id,
         "class": cls,
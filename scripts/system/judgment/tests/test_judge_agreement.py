@@ -86,6 +86,28 @@ def test_build_judge_prompt_includes_rubric_and_artifact():
     assert "STEP ONE do a thing" in prompt
 
 
+def test_append_corpus_record_dedups_against_the_target_file(tmp_path):
+    corpus = tmp_path / "corpus.jsonl"
+    kw = dict(artifact="a", verdict="FAIL", reasoning="r", path=corpus)
+    assert rj.append_corpus_record(record_id="override_d1", **kw) is True
+    assert rj.append_corpus_record(record_id="override_d1", **kw) is False
+    # a prefix of an existing id is a distinct record
+    assert rj.append_corpus_record(record_id="override_d", **kw) is True
+    ids = [json.loads(line)["id"] for line in corpus.read_text().splitlines()]
+    assert ids == ["override_d1", "override_d"]
+
+
+def test_append_corpus_record_dedups_ids_that_need_json_escaping(tmp_path):
+    corpus = tmp_path / "corpus.jsonl"
+    kw = dict(artifact="a", verdict="FAIL", reasoning="r", path=corpus)
+    for record_id in ('say "hi"', "back\\slash", "caf\u00e9"):
+        assert rj.append_corpus_record(record_id=record_id, **kw) is True
+        assert rj.append_corpus_record(record_id=record_id, **kw) is False
+    # a line written with ensure_ascii (escaped non-ASCII) still matches
+    corpus.write_text(json.dumps({"id": "na\u00efve"}) + "\n", encoding="utf-8")
+    assert rj.append_corpus_record(record_id="na\u00efve", **kw) is False
+
+
 # ── Scoring math ─────────────────────────────────────────────────────────────
 
 
@@ -119,6 +119,13 @@ def _is_test(wing: str, room: str, content: str) -> bool:
     return False
 
 
+def _mentions_dead_token(content: str) -> bool:
+    """True if the drawer content names a defunct token. The (possibly 20 KB+)
+    content is lowered once for all tokens, not once per token."""
+    lowered = content.lower()
+    return any(tok in lowered for tok in DEAD_TOKENS)
+
+
 def main() -> int:
     metas = arch._fetch_all_drawers(tool_list_drawers)
     total = len(metas)
@@ -162,7 +169,7 @@ def main() -> int:
             manifest["dead_name"].append({**entry, "reason": dn})
         if size > OVERSIZE_BYTES:
             manifest["oversized"].append(entry)
-        if any(tok in (d.content or "").lower() for tok in DEAD_TOKENS) and not dn:
+        if not dn and _mentions_dead_token(d.content or ""):
             manifest["content_mentions_dead"].append(entry)
 
     # ── Report ────────────────────────────────────────────────────────────
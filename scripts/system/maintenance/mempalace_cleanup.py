@@ -63,7 +63,7 @@ def delete_reason(d: "arch.DrawerMeta") -> str:
         return f"dead-name: {dn}"
     if wing in STRAY_WINGS:
         return f"stray agent-name wing '{wing}'"
-    if wing == "wing_jsa" and (room.startswith("plan-") or room.startswith("jsa-gj-")):
+    if wing == "wing_jsa" and room.startswith(("plan-", "jsa-gj-")):
         return "transient JSA scratch"
     if wing == "penny" and room == "technical" and len(content) > OVERSIZE_BYTES:
         return "oversized raw transcript"
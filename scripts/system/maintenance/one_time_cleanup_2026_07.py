@@ -82,17 +82,20 @@ def purge_test_junk(col, apply: bool) -> int:
     ids = all_meta.get("ids", [])
     metas = all_meta.get("metadatas", [])
     to_delete = []
+    queued = set()  # membership mirror of to_delete (a list scan per id is quadratic)
     for did, m in zip(ids, metas):
         wing = (m or {}).get("wing", "")
-        if wing.startswith("wing_test") or wing.startswith("wing_test-"):
+        if wing.startswith("wing_test"):
             to_delete.append(did)
+            queued.add(did)
     # Leaked test signals in the real signals room (by id prefix).
     for did in ids:
         low = did.lower()
         if any(
             t in low for t in ("dup_test", "multi1_", "multi2_", "signal_int_test", "test.entry")
         ):
-            if did not in to_delete:
+            if did not in queued:
+                queued.add(did)
                 to_delete.append(did)
     if to_delete and apply:
         for batch in _chunks(to_delete):
@@ -21,6 +21,7 @@ then a JSON body) so both sources are read identically by
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import os
@@ -31,6 +32,10 @@ from pathlib import Path
 from typing import Callable, Dict, List, Optional
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
+# Import roots of the lazily imported sibling packages, built once rather than on
+# every bridge read/write.
+_LIB_DIR = str(REPO_ROOT / "scripts" / "system" / "lib")
+_BRIDGE_DIR = str(REPO_ROOT / "scripts" / "system" / "bridge")
 
 VALID_DELTA = ("MATCH", "PARTIAL", "MISMATCH")
 VALID_CONFIDENCE = ("CERTAIN", "PROBABLE", "POSSIBLE", "UNCERTAIN", "")
@@ -83,14 +88,24 @@ _DOMAIN_KEYWORDS = (
     ("events", ("schedule", "calendar", "remind", "event", "meeting")),
     ("decision", ("decide", "should i", "choose", "which", "recommend")),
 )
+# One word-bounded alternation per domain, compiled once at import: a miss in
+# infer_domain is a single regex scan per domain instead of an escape + pattern
+# lookup per keyword. ``\b(?:a|b)\b`` matches iff some ``\ba\b``/``\bb\b`` does.
+_DOMAIN_PATTERNS = tuple(
+    (domain, re.compile(r"\b(?:" + "|".join(re.escape(k) for k in keywords) + r")\b"))
+    for domain, keywords in _DOMAIN_KEYWORDS
+)
 
 
+@functools.lru_cache(maxsize=1024)
 def infer_domain(goal: str) -> str:
     # Word-boundary match so "plan" doesn't fire on "plants" (and "code" not on
-    # "encode"). Keyword phrases match on their whole span.
+    # "encode"). Keyword phrases match on their whole span. Pure in ``goal`` and
+    # re-run on the same goal (rate_recent infers once to build the item and again
+    # to print it; classify_domain falls back to it), so exact-match memoized.
     text = (goal or "").lower()
-    for domain, keywords in _DOMAIN_KEYWORDS:
-        if any(re.search(rf"\b{re.escape(k)}\b", text) for k in keywords):
+    for domain, pattern in _DOMAIN_PATTERNS:
+        if pattern.search(text):
             return domain
     return "other"
 
@@ -160,9 +175,8 @@ def _extract_domain(text: Optional[str]) -> Optional[str]:
 
 def _load_pi_json_call():
     """Lazy-import the shared headless-pi caller (scripts/system/lib, #8)."""
-    lib = str(REPO_ROOT / "scripts" / "system" / "lib")
-    if lib not in sys.path:
-        sys.path.insert(0, lib)
+    if _LIB_DIR not in sys.path:
+        sys.path.insert(0, _LIB_DIR)
     from detect import pi_json_call  # type: ignore[import-not-found]
     return pi_json_call
 
@@ -198,9 +212,8 @@ def default_decision_id(session_id: str, goal: str) -> str:
 
 
 def _bridge_writer(payload: Dict[str, str]) -> Dict[str, str]:
-    bridge_dir = str(REPO_ROOT / "scripts" / "system" / "bridge")
-    if bridge_dir not in sys.path:
-        sys.path.insert(0, bridge_dir)
+    if _BRIDGE_DIR not in sys.path:
+        sys.path.insert(0, _BRIDGE_DIR)
     from memory_bridge import tool_add_drawer  # type: ignore[import-not-found]
 
     return tool_add_drawer(
@@ -309,24 +322,25 @@ def existing_decision_ids(
     ids = set()
     for d in drawers:
         content = str(d.get("content", ""))
-        first = content.splitlines()[0] if content else ""
+        # Only the first line is needed: slice it off instead of splitting the
+        # whole (possibly large) drawer body into lines.
+        first = content.partition("\n")[0].rstrip("\r")
         # header form: "decision_id: X | ..."
         if first.startswith("decision_id:"):
             ids.add(first.split("|", 1)[0].split(":", 1)[1].strip())
             continue
         try:
-            obj = json.loads(content.splitlines()[0]) if content else {}
+            obj = json.loads(first) if first else {}
             if obj.get("decision_id"):
                 ids.add(obj["decision_id"])
-        except (json.JSONDecodeError, ValueError, IndexError):
+        except (json.JSONDecodeError, ValueError, AttributeError):
             continue
     return ids
 
 
 def _bridge_reader() -> List[Dict[str, object]]:
-    bridge_dir = str(REPO_ROOT / "scripts" / "system" / "bridge")
-    if bridge_dir not in sys.path:
-        sys.path.insert(0, bridge_dir)
+    if _BRIDGE_DIR not in sys.path:
+        sys.path.insert(0, _BRIDGE_DIR)
     from memory_bridge import tool_list_drawers  # type: ignore[import-not-found]
 
     res = tool_list_drawers(
@@ -340,10 +354,12 @@ def _bridge_reader() -> List[Dict[str, object]]:
 def parse_outcome_drawer(drawer: Dict[str, object]) -> Optional[Dict[str, object]]:
     """Parse an outcome drawer's JSON body; attach its drawer id for updates."""
     content = str(drawer.get("content", ""))
-    lines = content.splitlines()
-    if not lines:
+    if not content:
         return None
-    body = lines[1] if len(lines) > 1 and lines[0].startswith("decision_id:") else lines[0]
+    # Header line + JSON body line: slice the two lines off rather than splitting
+    # the whole drawer into a list of every line.
+    first, _, rest = content.partition("\n")
+    body = rest.partition("\n")[0] if rest and first.startswith("decision_id:") else first
     try:
         record = json.loads(body)
     except (json.JSONDecodeError, ValueError):
@@ -449,9 +465,8 @@ def override_outcome(
 
 
 def _bridge_deleter(drawer_id: str) -> object:
-    bridge_dir = str(REPO_ROOT / "scripts" / "system" / "bridge")
-    if bridge_dir not in sys.path:
-        sys.path.insert(0, bridge_dir)
+    if _BRIDGE_DIR not in sys.path:
+        sys.path.insert(0, _BRIDGE_DIR)
     from memory_bridge import tool_delete_drawer  # type: ignore[import-not-found]
 
     return tool_delete_drawer({"drawer_id": drawer_id})
@@ -359,14 +359,17 @@ def main() -> int:
         )
         return 0
 
-    pending = pending_sessions(recent_session_goals(con, args.limit), _safe_existing_ids(args.json))
+    # One palace read: the same id set filters the pending list and then dedups
+    # the interactive writes (capture_outcome adds each new id to it on insert).
+    existing = _safe_existing_ids(args.json)
+    pending = pending_sessions(recent_session_goals(con, args.limit), existing)
 
     if args.json:
         print(json.dumps({"pending": len(pending)}))
     elif not pending:
         print("Nothing to rate — recent sessions already have outcomes. ✓")
     else:
-        _run_interactive(pending, _safe_existing_ids(args.json))
+        _run_interactive(pending, existing)
     return 0
 
 
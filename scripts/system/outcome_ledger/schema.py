@@ -1,9 +1,16 @@
 """Outcome Ledger schema and validation."""
 
+import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Literal
 
+# Built once: every ledger write serializes a record and every read_recent /
+# load_recent_outcomes parses one per drawer, so the codec (and the json import)
+# should not be re-resolved per record.
+_ENCODER = json.JSONEncoder()
+_DECODER = json.JSONDecoder()
+
 DeltaScore = Literal["MATCH", "PARTIAL", "MISMATCH", ""]
 ConfidenceLevel = Literal["CERTAIN", "PROBABLE", "POSSIBLE", "UNCERTAIN", ""]
 DomainCategory = Literal[
@@ -36,9 +43,7 @@ class OutcomeRecord:
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        import json
-
-        return json.dumps(
+        return _ENCODER.encode(
             {
                 "decision_id": self.decision_id,
                 "session_id": self.session_id,
@@ -56,10 +61,7 @@ class OutcomeRecord:
     @classmethod
     def from_json(cls, raw: str) -> "OutcomeRecord":
         """Deserialize from JSON string."""
-        import json
-
-        data = json.loads(raw)
-        return cls(**data)
+        return cls(**_DECODER.decode(raw))
 
     def validate(self) -> None:
         """Validate required fields. Raise ValueError on failure."""
@@ -37,6 +37,14 @@ def test_infer_domain():
     assert capture.infer_domain("water the plants") == "other"
 
 
+def test_infer_domain_memoized():
+    capture.infer_domain.cache_clear()
+    assert capture.infer_domain("plan the migration") == "planning"
+    assert capture.infer_domain("plan the migration") == "planning"
+    info = capture.infer_domain.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
 # ── #11: model domain classifier (keyword as resilient fallback) ─────────────
 
 
@@ -284,6 +292,16 @@ def test_parse_outcome_drawer_and_load_by_source():
     assert autos[0]["_drawer_id"] == "da"
 
 
+def test_parse_outcome_drawer_reads_only_header_and_body_lines():
+    drawer = _outcome_drawer("d_crlf", "MATCH", "judge_auto")
+    drawer["content"] = drawer["content"].replace("\n", "\r\n") + "\r\ntrailing prose\n" * 3
+    record = capture.parse_outcome_drawer(drawer)
+    assert record["decision_id"] == "d_crlf"
+    assert capture.existing_decision_ids(reader=lambda: [drawer]) == {"d_crlf"}
+    assert capture.parse_outcome_drawer({"content": ""}) is None
+    assert capture.parse_outcome_drawer({"content": "decision_id: x | delta_score: MATCH"}) is None
+
+
 def test_load_recent_outcomes_windows_and_sorts_newest_first():
     import datetime as _dt
 
@@ -409,6 +427,22 @@ def test_pending_sessions_empty_when_all_rated():
     assert rate_recent.pending_sessions(goals, existing) == []
 
 
+def test_interactive_run_reads_existing_ids_once(monkeypatch):
+    goal = "a substantive goal that is long enough to count here"
+    con = _obs_with_entries([("s1", "user", 1, goal)])
+    reads = []
+    handed = []
+    monkeypatch.setattr(rate_recent, "open_obs", lambda: con)
+    monkeypatch.setattr(rate_recent, "existing_decision_ids", lambda: reads.append(1) or set())
+    monkeypatch.setattr(rate_recent, "_run_interactive", lambda p, ex: handed.append((p, ex)))
+    monkeypatch.setattr(sys, "argv", ["rate_recent.py"])
+
+    assert rate_recent.main() == 0
+    assert len(reads) == 1  # the pending filter and the write dedup share one read
+    [(pending, existing)] = handed
+    assert [p[0] for p in pending] == ["s1"] and existing == set()
+
+
 # ── args-based rating interface (what Penny drives in-conversation, no stdin) ──
 
 
@@ -79,12 +79,15 @@ def _protected_spans(content: str) -> "list[tuple[int, int]]":
     return spans
 
 
-def _protected_text(content: str) -> str:
+def _protected_text(content: str, spans: "Optional[list[tuple[int, int]]]" = None) -> str:
     """(#22) The concatenated text of every immutable security-block region — the
     invariant that must be byte-identical before and after any apply. Position-
     independent: edits ELSEWHERE (which shift offsets) leave this string unchanged;
-    any edit to a block's content, or a newly injected block, changes it."""
-    return "\x00".join(content[s:e] for s, e in _protected_spans(content))
+    any edit to a block's content, or a newly injected block, changes it. Pass
+    ``spans`` when they are already computed for ``content``."""
+    if spans is None:
+        spans = _protected_spans(content)
+    return "\x00".join(content[s:e] for s, e in spans)
 
 
 def _rollback(target_file: str, original: str) -> None:
@@ -95,14 +98,23 @@ def _rollback(target_file: str, original: str) -> None:
         pass
 
 
-def _touches_security_block(content: str, change: Dict[str, str]) -> bool:
+def _touches_security_block(
+    content: str,
+    change: Dict[str, str],
+    spans: "Optional[list[tuple[int, int]]]" = None,
+) -> bool:
     """True if a change would add, remove, reword, or edit INSIDE the immutable
-    security-directives block — refused even for an APPROVED amendment."""
+    security-directives block — refused even for an APPROVED amendment.
+
+    ``spans`` lets a caller checking several changes against the same content
+    scan for the protected blocks once instead of once (or twice) per change."""
     old_text = change.get("old_text", "") or ""
     new_text = change.get("new_text", "") or ""
+    if spans is None:
+        spans = _protected_spans(content)
     # 0) An ADD appends to EOF; on a file that carries the immutable frame that
     #    would place content after </system_boundary>. Require an anchored MODIFY.
-    if (change.get("action") or "ADD").upper() == "ADD" and _protected_spans(content):
+    if (change.get("action") or "ADD").upper() == "ADD" and spans:
         return True
     # 1) The payload must not introduce / remove / reword a security sentinel.
     for sentinel in _SECURITY_SENTINELS:
@@ -110,7 +122,6 @@ def _touches_security_block(content: str, change: Dict[str, str]) -> bool:
             return True
     # 2) A MODIFY/REMOVE whose matched region sits inside a protected span.
     if old_text:
-        spans = _protected_spans(content)
         idx = content.find(old_text)
         while idx != -1:
             end = idx + len(old_text)
@@ -279,8 +290,9 @@ def apply_amendment(  # noqa: C901 (linear validate-then-apply guard chain)
         current = Path(target_file).read_text(encoding="utf-8")
     except OSError as exc:
         return {"success": False, "error": f"could not read target: {exc}", "committed": False}
+    current_spans = _protected_spans(current)
     for change in changes:
-        if _touches_security_block(current, change):
+        if _touches_security_block(current, change, current_spans):
             return {
                 "success": False,
                 "error": (
@@ -292,7 +304,7 @@ def apply_amendment(  # noqa: C901 (linear validate-then-apply guard chain)
     # #22: snapshot the pre-apply content (for atomic rollback) and the immutable
     # frame (for the R5 post-apply invariant).
     original = current
-    before_protected = _protected_text(current)
+    before_protected = _protected_text(current, current_spans)
 
     # R4 — behavioral-regression gate: don't layer a new change on top of an
     # unacknowledged drift below Oracle-era quality (see scripts/system/trajectory/).
@@ -7,11 +7,11 @@ Handles ID generation, risk scoring, action inference, and validation.
 import json
 import os
 import re
+import secrets
 import sys
-from datetime import date, datetime
+from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from uuid import uuid4
 
 from amendment_applier import _touches_security_block  # the security authority
 
@@ -45,7 +45,7 @@ class AmendmentAction:
     REMOVE = "REMOVE"
 
 
-def _next_id() -> str:
+def _next_id(now: Optional[datetime] = None) -> str:
     """Generate unique amendment ID: amend_YYYY-MM-DD_HHMMSS_xxxx.
 
     Time-sortable and collision-proof across processes — the old date+counter
@@ -53,10 +53,11 @@ def _next_id() -> str:
     one date could both mint amend_<date>_001 and a review CLI keyed on
     amendment_id would act on the wrong record.
     """
-    return (
-        f"amend_{date.today().isoformat()}_"
-        f"{datetime.now().strftime('%H%M%S')}_{uuid4().hex[:4]}"
-    )
+    # One clock read for both date and time (two reads can straddle midnight), and
+    # the 4-hex suffix straight from secrets rather than a sliced UUID object.
+    # ``now`` lets a caller share its own read so the id and proposed_date agree.
+    now = now or datetime.now()
+    return f"amend_{now.date().isoformat()}_{now.strftime('%H%M%S')}_{secrets.token_hex(2)}"
 
 
 def _clip(text: str, cap: int) -> str:
@@ -110,6 +111,8 @@ def generate_amendment(
     Status is PENDING on success, INVALID if validation fails.
     """
     errors = []
+    # One clock read per record: the id's date and proposed_date come from it.
+    now = datetime.now()
 
     if not evidence:
         errors.append("Amendment requires evidence (non-empty evidence list)")
@@ -118,8 +121,8 @@ def generate_amendment(
 
     if errors:
         return {
-            "amendment_id": _next_id(),
-            "proposed_date": date.today().isoformat(),
+            "amendment_id": _next_id(now),
+            "proposed_date": now.date().isoformat(),
             "target_layer": target_layer,
             "target_file": target_file,
             "trigger": learning,
@@ -153,8 +156,8 @@ def generate_amendment(
         )
 
     record = {
-        "amendment_id": _next_id(),
-        "proposed_date": date.today().isoformat(),
+        "amendment_id": _next_id(now),
+        "proposed_date": now.date().isoformat(),
         "target_layer": target_layer,
         "target_file": target_file,
         "trigger": _clip(learning, 240),
@@ -15,7 +15,7 @@ import re
 import sys
 from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Optional
 
 from target_classifier import classify_target, TargetLayer
 from amendment_generator import generate_amendment, draft_change
@@ -40,6 +40,17 @@ _FAILURE_MODE_PHRASE = {
     "refused_wrongly": "declined a valid, in-scope request",
 }
 
+# Domain → Domain Guidance file, built once at import rather than per cluster.
+_DEFAULT_GUIDANCE_FILE = ".pi/skills/plan/assets/prompts/piper.md"
+_DOMAIN_FILE_MAP = {
+    "coding": _DEFAULT_GUIDANCE_FILE,
+    "planning": _DEFAULT_GUIDANCE_FILE,
+    "exploration": ".pi/skills/plan/assets/prompts/echo.md",
+    "critique": ".pi/skills/plan/assets/prompts/carren.md",
+    "testing": ".pi/skills/plan/assets/prompts/carren.md",
+    "taskify": ".pi/skills/plan/assets/prompts/tabitha.md",
+}
+
 
 def _grouping_key(outcome: Dict[str, Any]) -> str:
     """The key the compression loop clusters on.
@@ -70,14 +81,12 @@ def identify_patterns(outcomes: List[Dict[str, Any]]) -> List[str]:
     failure_mode, else normalized reason) and returns the keys meeting the
     recurrence threshold.
     """
-    relevant = [o for o in outcomes if o.get("outcome") in ("MISMATCH", "PARTIAL")]
-    if not relevant:
-        return []
-
-    keys = [_grouping_key(o) for o in relevant]
-    keys = [k for k in keys if k]
-
-    counts = Counter(keys)
+    # Filter + key + count in one streamed pass; Counter tallies in C, with no
+    # intermediate relevant/keys lists. Empty keys are counted and then ignored.
+    counts = Counter(
+        _grouping_key(o) for o in outcomes if o.get("outcome") in ("MISMATCH", "PARTIAL")
+    )
+    counts.pop("", None)
     return [key for key, count in counts.items() if count >= _PATTERN_THRESHOLD]
 
 
@@ -232,15 +241,7 @@ def _map_domain_to_target_file(domain: str) -> str:
     This is a heuristic — in production, the classification logic would
     be more sophisticated or use domain-specific metadata.
     """
-    _DOMAIN_FILE_MAP = {
-        "coding": ".pi/skills/plan/assets/prompts/piper.md",
-        "planning": ".pi/skills/plan/assets/prompts/piper.md",
-        "exploration": ".pi/skills/plan/assets/prompts/echo.md",
-        "critique": ".pi/skills/plan/assets/prompts/carren.md",
-        "testing": ".pi/skills/plan/assets/prompts/carren.md",
-        "taskify": ".pi/skills/plan/assets/prompts/tabitha.md",
-    }
-    return _DOMAIN_FILE_MAP.get(domain.lower(), ".pi/skills/plan/assets/prompts/piper.md")
+    return _DOMAIN_FILE_MAP.get(domain.lower(), _DEFAULT_GUIDANCE_FILE)
 
 
 def run_compression_loop(
@@ -248,12 +249,16 @@ def run_compression_loop(
     previous_amendments: Optional[List[Dict[str, Any]]] = None,
     *,
     runner=None,
+    previous_loader: Optional[Callable[[], List[Dict[str, Any]]]] = None,
 ) -> List[Dict[str, Any]]:
     """Run the full compression loop on a set of outcomes.
 
     Failures are grouped by ``cluster_outcomes`` — semantic (model) when
     PI_SELFIMPROVE_CLUSTER_MODEL is set, else exact-string on the categorical
     failure_mode/reason. Returns a list of proposed amendment dicts.
+
+    ``previous_loader`` stands in for ``previous_amendments`` when reading them
+    is costly: it is only called once there are new amendments to dedup.
     """
     relevant = [o for o in outcomes if o.get("outcome") in ("MISMATCH", "PARTIAL")]
     clusters = cluster_outcomes(relevant, runner=runner)
@@ -318,4 +323,6 @@ def run_compression_loop(
             )
         amendments.append(amendment)
 
+    if previous_amendments is None and previous_loader is not None:
+        previous_amendments = previous_loader()
     return _deduplicate(amendments, previous_amendments)
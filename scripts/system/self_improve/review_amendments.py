@@ -38,7 +38,7 @@ import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 _HERE = Path(__file__).resolve().parent
 _REPO_ROOT = _HERE.parents[2]
@@ -264,6 +264,15 @@ def cmd_apply(amendment_id: str, git_commit: bool) -> int:
     return 0
 
 
+_COMMANDS: Dict[str, Callable[[argparse.Namespace], int]] = {
+    "list": lambda args: cmd_list(args.show_all),
+    "show": lambda args: cmd_show(args.amendment_id),
+    "approve": lambda args: cmd_approve(args.amendment_id),
+    "reject": lambda args: cmd_reject(args.amendment_id),
+    "apply": lambda args: cmd_apply(args.amendment_id, git_commit=not args.no_commit),
+}
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
     sub = parser.add_subparsers(dest="command", required=True)
@@ -278,17 +287,8 @@ def main() -> int:
     p_apply.add_argument("--no-commit", action="store_true")
     args = parser.parse_args()
 
-    if args.command == "list":
-        return cmd_list(args.show_all)
-    if args.command == "show":
-        return cmd_show(args.amendment_id)
-    if args.command == "approve":
-        return cmd_approve(args.amendment_id)
-    if args.command == "reject":
-        return cmd_reject(args.amendment_id)
-    if args.command == "apply":
-        return cmd_apply(args.amendment_id, git_commit=not args.no_commit)
-    return 2
+    handler = _COMMANDS.get(args.command)
+    return handler(args) if handler else 2
 
 
 if __name__ == "__main__":
@@ -251,8 +251,10 @@ def main() -> int:
             print(json.dumps({"amendments_created": 0, "session_id": session_id}))
             return 0
 
-        previous_amendments = fetch_previous_amendments(session_id)
-        amendments = run_compression_loop(outcomes, previous_amendments=previous_amendments)
+        # The amendments room is only read once there is something to dedup.
+        amendments = run_compression_loop(
+            outcomes, previous_loader=lambda: fetch_previous_amendments(session_id)
+        )
 
         if not amendments:
             info(
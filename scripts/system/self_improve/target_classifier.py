@@ -175,9 +175,17 @@ _DOMAIN_KEYWORDS = frozenset(
 )
 
 
-def _score(text_lower: str, keywords: frozenset) -> int:
-    """Count how many keyword phrases appear in text."""
-    return sum(1 for kw in keywords if kw in text_lower)
+def _any_keyword_re(keywords: frozenset) -> "re.Pattern[str]":
+    """One alternation over a keyword set (longest first, sorted for a stable
+    pattern): a single C-level scan answers "does ANY phrase occur" — all the
+    classifier needs — instead of a Python-level substring test per keyword."""
+    ordered = sorted(keywords, key=lambda k: (-len(k), k))
+    return re.compile("|".join(re.escape(kw) for kw in ordered))
+
+
+_UNIVERSAL_RE = _any_keyword_re(_UNIVERSAL_KEYWORDS)
+_PREFERENCE_RE = _any_keyword_re(_PREFERENCE_KEYWORDS)
+_CONFIG_RE = _any_keyword_re(_CONFIG_KEYWORDS)
 
 
 def _classify_by_keywords(
@@ -190,11 +198,11 @@ def _classify_by_keywords(
     if not learning_description:
         learning_description = ""
     text = learning_description.lower()
-    if _score(text, _UNIVERSAL_KEYWORDS) > 0:
+    if _UNIVERSAL_RE.search(text):
         return TargetLayer.REJECTED_UNIVERSAL
-    if _score(text, _PREFERENCE_KEYWORDS) > 0:
+    if _PREFERENCE_RE.search(text):
         return TargetLayer.MEMPALACE_PREF
-    if _score(text, _CONFIG_KEYWORDS) > 0:
+    if _CONFIG_RE.search(text):
         return TargetLayer.CONFIG
     return TargetLayer.DOMAIN_GUIDANCE
 
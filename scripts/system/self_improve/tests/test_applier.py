@@ -14,7 +14,9 @@ from amendment_applier import (  # noqa: E402
     apply_amendment,
     _write_file_change,
     _build_commit_message,
+    _protected_spans,
     _protected_text,
+    _touches_security_block,
 )
 
 
@@ -340,3 +342,17 @@ def test_protected_text_extracts_only_block_content():
     assert "SECRET" in pt and "</system_directives>" in pt
     assert "before" not in pt and "after" not in pt
     assert _protected_text("just text with no frame") == ""
+
+
+def test_precomputed_spans_give_the_same_answers():
+    content = "intro\n<system_boundary>\nfence\n</system_boundary>\nbody\n"
+    spans = _protected_spans(content)
+    assert _protected_text(content, spans) == _protected_text(content)
+    for change in (
+        {"action": "ADD", "new_text": "x"},
+        {"action": "MODIFY", "old_text": "fence", "new_text": "y"},
+        {"action": "MODIFY", "old_text": "body", "new_text": "z"},
+    ):
+        assert _touches_security_block(content, change, spans) == _touches_security_block(
+            content, change
+        )
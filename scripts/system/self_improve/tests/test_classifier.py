@@ -156,8 +156,14 @@ class TestClassifyTargetEdgeCases:
 
 
 def _stream(text: str) -> str:
-    msg = {"type": "message_end", "message": {"role": "assistant", "stopReason": "stop",
-           "content": [{"type": "text", "text": text}]}}
+    msg = {
+        "type": "message_end",
+        "message": {
+            "role": "assistant",
+            "stopReason": "stop",
+            "content": [{"type": "text", "text": text}],
+        },
+    }
     return json.dumps({"type": "agent_start"}) + "\n" + json.dumps(msg)
 
 
@@ -189,37 +195,67 @@ class TestClassifyTargetModel:
         monkeypatch.setenv(self._ENV, "anthropic/haiku")
         # keywords would (wrongly) REJECT this on "validation"; the model routes it right
         runner = _fake_runner(_stream('{"layer": "DOMAIN_GUIDANCE"}'))
-        assert classify_target(
-            "improve input validation in the code skill", [], runner=runner
-        ) == TargetLayer.DOMAIN_GUIDANCE
+        assert (
+            classify_target("improve input validation in the code skill", [], runner=runner)
+            == TargetLayer.DOMAIN_GUIDANCE
+        )
 
     def test_model_can_reject_universal(self, monkeypatch):
         monkeypatch.setenv(self._ENV, "anthropic/haiku")
         runner = _fake_runner(_stream('{"layer": "REJECTED_UNIVERSAL"}'))
-        assert classify_target(
-            "always disclose uncertainty in every answer", [], runner=runner
-        ) == TargetLayer.REJECTED_UNIVERSAL
+        assert (
+            classify_target("always disclose uncertainty in every answer", [], runner=runner)
+            == TargetLayer.REJECTED_UNIVERSAL
+        )
 
     def test_model_preference_and_config(self, monkeypatch):
         monkeypatch.setenv(self._ENV, "anthropic/haiku")
-        assert classify_target(
-            "x", [], runner=_fake_runner(_stream('{"layer":"MEMPALACE_PREF"}'))
-        ) == TargetLayer.MEMPALACE_PREF
-        assert classify_target(
-            "x", [], runner=_fake_runner(_stream('{"layer":"CONFIG"}'))
-        ) == TargetLayer.CONFIG
+        assert (
+            classify_target("x", [], runner=_fake_runner(_stream('{"layer":"MEMPALACE_PREF"}')))
+            == TargetLayer.MEMPALACE_PREF
+        )
+        assert (
+            classify_target("x", [], runner=_fake_runner(_stream('{"layer":"CONFIG"}')))
+            == TargetLayer.CONFIG
+        )
 
     def test_falls_back_on_model_failure(self, monkeypatch):
         monkeypatch.setenv(self._ENV, "anthropic/haiku")
         # spawn raises -> keyword fallback; "timeout" -> CONFIG
-        assert classify_target(
-            "increase the timeout", [], runner=_fake_runner(raise_exc=OSError("x"))
-        ) == TargetLayer.CONFIG
+        assert (
+            classify_target("increase the timeout", [], runner=_fake_runner(raise_exc=OSError("x")))
+            == TargetLayer.CONFIG
+        )
 
     def test_falls_back_on_bad_label(self, monkeypatch):
         monkeypatch.setenv(self._ENV, "anthropic/haiku")
         # invalid layer -> keyword fallback (this text -> DOMAIN_GUIDANCE)
-        assert classify_target(
-            "assume uv without checking the project", [],
-            runner=_fake_runner(_stream('{"layer": "NONSENSE"}'))
-        ) == TargetLayer.DOMAIN_GUIDANCE
+        assert (
+            classify_target(
+                "assume uv without checking the project",
+                [],
+                runner=_fake_runner(_stream('{"layer": "NONSENSE"}')),
+            )
+            == TargetLayer.DOMAIN_GUIDANCE
+        )
+
+
+class TestKeywordScan:
+    """The combined-alternation scan agrees with a per-keyword substring test."""
+
+    def test_alternation_matches_substring_semantics(self):
+        import target_classifier as tc
+
+        for keywords, pattern in (
+            (tc._UNIVERSAL_KEYWORDS, tc._UNIVERSAL_RE),
+            (tc._PREFERENCE_KEYWORDS, tc._PREFERENCE_RE),
+            (tc._CONFIG_KEYWORDS, tc._CONFIG_RE),
+        ):
+            for text in (
+                "increase timeout for slow ci",
+                "user prefers terse output",
+                "the self-verification step",
+                "nothing relevant here",
+            ):
+                expected = any(kw in text for kw in keywords)
+                assert bool(pattern.search(text)) is expected
@@ -232,6 +232,22 @@ class TestRunCompressionLoop:
         result2 = run_compression_loop(outcomes, previous_amendments=result1)
         assert len(result2) == 0  # deduplicated
 
+    def test_previous_loader_dedups_like_previous_amendments(self):
+        outcomes = [
+            {"decision_id": "d1", "outcome": "MISMATCH", "domain": "coding", "reason": "x"},
+            {"decision_id": "d2", "outcome": "MISMATCH", "domain": "coding", "reason": "x"},
+        ]
+        result1 = run_compression_loop(outcomes)
+        assert run_compression_loop(outcomes, previous_loader=lambda: result1) == []
+
+    def test_previous_loader_skipped_without_patterns(self):
+        """Nothing to dedup → the previous-amendments read never happens."""
+        calls = []
+        outcomes = [{"decision_id": "d1", "outcome": "MATCH", "domain": "coding"}]
+        result = run_compression_loop(outcomes, previous_loader=lambda: calls.append(1) or [])
+        assert result == []
+        assert calls == []
+
 
 # ── #20: semantic clustering (model-first, exact-string fallback) ─────────────
 
@@ -4,6 +4,7 @@ ids, repo-root git commits, and the review CLI's drawer-rewrite mechanics."""
 import json
 import subprocess
 import sys
+from datetime import datetime
 from pathlib import Path
 from types import ModuleType
 from unittest.mock import MagicMock
@@ -64,6 +65,16 @@ class TestAmendmentIds:
         assert parts[0] == "amend"
         assert len(parts) == 4  # amend, date, HHMMSS, hex4
 
+    def test_id_date_matches_proposed_date(self):
+        record = generate_amendment(
+            learning="l", evidence=["e"], target_layer="CONFIG", target_file="x", proposed_text="t"
+        )
+        assert record["amendment_id"].split("_")[1] == record["proposed_date"]
+
+    def test_shared_clock_read(self):
+        aid = _next_id(datetime(2026, 7, 5, 23, 59, 58))
+        assert aid.startswith("amend_2026-07-05_235958_")
+
     def test_generate_amendment_carries_domain(self):
         record = generate_amendment(
             learning="l",
@@ -141,6 +141,12 @@ def _parse_outcome_text(text: str) -> dict:
     return rec
 
 
+# Per-pass memo of the parsed ledger. run_all_metric_watchers opens it ({}) so the
+# outcome-mining watchers in one pass share a single full-ledger read, and resets
+# it to None when the pass ends — a later pass or a direct watcher call reads fresh.
+_OUTCOME_PASS: Optional[dict] = None
+
+
 def _load_outcome_records() -> list:
     """Load EVERY outcome record with full content — the accurate ledger read.
 
@@ -150,7 +156,12 @@ def _load_outcome_records() -> list:
     out of the summary — so watcher metrics were computed over a biased sample
     of the ledger, not the ledger. Each record carries ``_when`` (aware UTC
     from the record timestamp, falling back to the drawer's filed_at) or None.
+
+    Inside a watcher pass the parsed records are memoized (records are shallow
+    copies of the snapshot); a failed read is not cached.
     """
+    if _OUTCOME_PASS is not None and "records" in _OUTCOME_PASS:
+        return [dict(r) for r in _OUTCOME_PASS["records"]]
     result = tool_list_drawers(
         {"wing": "penny", "room": "outcomes", "limit": 10000, "include_content": True}
     )
@@ -168,6 +179,9 @@ def _load_outcome_records() -> list:
             when = when.replace(tzinfo=timezone.utc)
         rec["_when"] = when
         records.append(rec)
+    if _OUTCOME_PASS is not None:
+        _OUTCOME_PASS["records"] = tuple(records)
+        return [dict(r) for r in records]
     return records
 
 
@@ -311,14 +325,19 @@ def _window_series(records, predicate, *, window_days, n_prior, ratio=False):
     ``total`` is the window's record count (0 marks an INACTIVE window the caller drops
     from the baseline, so a sparse ledger cold-starts on the static threshold)."""
     now = _now()
+    span = timedelta(days=window_days)
+    # One pass buckets each record by age: window k holds ages in (k*span, (k+1)*span],
+    # and the current window also takes anything newer than now.
+    buckets: list = [[] for _ in range(n_prior + 1)]
+    for r in records:
+        when = r.get("_when")
+        if not when:
+            continue
+        k = max(0, -(-(now - when) // span) - 1)
+        if k <= n_prior:
+            buckets[k].append(r)
     out: list = []
-    for k in range(n_prior + 1):
-        lo = now - timedelta(days=window_days * (k + 1))
-        hi = now - timedelta(days=window_days * k)
-        bucket = [
-            r for r in records
-            if r.get("_when") and (r["_when"] >= lo if k == 0 else lo <= r["_when"] < hi)
-        ]
+    for bucket in buckets:
         hits = sum(1 for r in bucket if predicate(r))
         value = (hits / len(bucket)) if (ratio and bucket) else (0.0 if ratio else float(hits))
         out.append((value, len(bucket)))
@@ -747,9 +766,10 @@ def generate_tune_due_signal(session_id: str) -> Optional[dict]:
         conditions.append(f"{p}: {info['reason']} (age: {age_str})")
     conditions.extend(rating_conditions)
 
-    # FR-18: CRITICAL escalation — trajectory stale AND >=1 PENDING/APPROVED amendment
-    amendments_count = _count_pending_amendments()
+    # FR-18: CRITICAL escalation — trajectory stale AND >=1 PENDING/APPROVED amendment.
+    # The amendments read only matters for escalation, so skip it otherwise.
     trajectory_stale = "trajectory" in stale_list
+    amendments_count = _count_pending_amendments() if trajectory_stale else 0
     priority = "CRITICAL" if (trajectory_stale and amendments_count > 0) else "INFO"
 
     # Title and suggested action
@@ -887,48 +907,53 @@ def run_all_metric_watchers(session_id: str) -> list[str]:
         generate_task_staleness_signal,
         generate_tune_due_signal,
     ]
-    for fn in funcs:
-        watcher_name = fn.__name__
-        try:
-            debug("ambient_watchers", f"Running watcher {watcher_name}", session_id=session_id)
-            sig = fn(session_id)
-            if sig:
-                debug(
-                    "ambient_watchers",
-                    f"Watcher {watcher_name} generated signal {sig.get('signal_id')}",
-                    session_id=session_id,
-                )
-                drawer_id = write_signal(sig, session_id=session_id)
-                if drawer_id:
-                    generated.append(sig["signal_id"])
-                    info(
+    global _OUTCOME_PASS
+    _OUTCOME_PASS = {}
+    try:
+        for fn in funcs:
+            watcher_name = fn.__name__
+            try:
+                debug("ambient_watchers", f"Running watcher {watcher_name}", session_id=session_id)
+                sig = fn(session_id)
+                if sig:
+                    debug(
                         "ambient_watchers",
-                        f"Signal {sig['signal_id']} persisted",
+                        f"Watcher {watcher_name} generated signal {sig.get('signal_id')}",
                         session_id=session_id,
-                        data={
-                            "watcher": watcher_name,
-                            "drawer_id": drawer_id,
-                            "priority": sig.get("priority"),
-                        },
                     )
+                    drawer_id = write_signal(sig, session_id=session_id)
+                    if drawer_id:
+                        generated.append(sig["signal_id"])
+                        info(
+                            "ambient_watchers",
+                            f"Signal {sig['signal_id']} persisted",
+                            session_id=session_id,
+                            data={
+                                "watcher": watcher_name,
+                                "drawer_id": drawer_id,
+                                "priority": sig.get("priority"),
+                            },
+                        )
+                    else:
+                        warn(
+                            "ambient_watchers",
+                            f"Signal {sig['signal_id']} from {watcher_name} was not persisted (duplicate or error)",
+                            session_id=session_id,
+                        )
                 else:
-                    warn(
+                    debug(
                         "ambient_watchers",
-                        f"Signal {sig['signal_id']} from {watcher_name} was not persisted (duplicate or error)",
+                        f"Watcher {watcher_name} produced no signal",
                         session_id=session_id,
                     )
-            else:
-                debug(
-                    "ambient_watchers",
-                    f"Watcher {watcher_name} produced no signal",
-                    session_id=session_id,
+            except Exception as exc:
+                exception(
+                    "ambient_watchers", f"Watcher {watcher_name} failed", exc, session_id=session_id
                 )
-        except Exception as exc:
-            exception(
-                "ambient_watchers", f"Watcher {watcher_name} failed", exc, session_id=session_id
-            )
-            # Individual watcher failures must not crash the pipeline
-            continue
+                # Individual watcher failures must not crash the pipeline
+                continue
+    finally:
+        _OUTCOME_PASS = None
 
     info(
         "ambient_watchers",
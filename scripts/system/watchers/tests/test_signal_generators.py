@@ -140,6 +140,23 @@ class TestHelpers:
         assert params["include_content"] is True
         assert params["limit"] >= 10000
 
+    @patch("signal_generators.tool_list_drawers")
+    def test_load_records_memoized_only_within_a_watcher_pass(self, mock_list):
+        import signal_generators
+
+        mock_list.return_value = _ledger(_outcome_drawer("MISMATCH"))
+        _load_outcome_records()
+        _load_outcome_records()
+        assert mock_list.call_count == 2  # outside a pass: always a fresh read
+
+        mock_list.reset_mock()
+        with patch.object(signal_generators, "_OUTCOME_PASS", {}):
+            first = _load_outcome_records()
+            first[0]["outcome"] = "mutated"
+            second = _load_outcome_records()
+        assert mock_list.call_count == 1  # one ledger read shared across the pass
+        assert second[0]["outcome"] == "MISMATCH"  # callers get copies
+
 
 class TestMismatchRateSignal:
     """Test MISMATCH rate watcher (full-ledger read)."""
@@ -514,6 +531,20 @@ class TestTuneDueSignal:
         assert result is not None
         assert result["priority"] == "CRITICAL"
 
+    @patch("signal_generators._count_unrated_sessions", return_value=12)
+    @patch("signal_generators._days_since_last_rating", return_value=None)
+    @patch("signal_generators._count_pending_amendments", return_value=3)
+    @patch("signal_generators.check_all_stale")
+    def test_amendments_not_read_unless_trajectory_stale(
+        self, mock_stale, mock_amend, mock_days, mock_unrated
+    ):
+        """FR-18: the amendments read only feeds escalation — skipped otherwise."""
+        mock_stale.return_value = _stale_staleness(["prompt_efficacy"])
+        result = generate_tune_due_signal("test-session")
+        assert result is not None
+        assert result["priority"] == "INFO"
+        mock_amend.assert_not_called()
+
     # ── FR-6: Dedup / SM-3: single source of truth ─────────────────────────
 
     @patch("signal_generators._count_unrated_sessions", return_value=0)